@@ -0,0 +1,182 @@
+import math
+from typing import List, NamedTuple, Optional, Tuple
+
+LEAF_SIZE = 2           # maximum objects per BVH leaf
+# Scenes with at most this many bounded objects are scanned linearly: below it the
+# box tests and stack cost more than they cull (break-even measured at 25-35 spheres)
+LINEAR_SCAN_LIMIT = 32
+
+
+# ---------- AABB ----------
+
+class AABB(NamedTuple):
+    """Axis-aligned box given by its (min corner, max corner); unpacks as lo, hi."""
+    lo: Tuple[float, float, float]
+    hi: Tuple[float, float, float]
+
+    @staticmethod
+    def union(boxes: List['AABB']) -> 'AABB':
+        """Smallest box enclosing all the given boxes."""
+        return AABB(
+            tuple(min(box.lo[i] for box in boxes) for i in range(3)),
+            tuple(max(box.hi[i] for box in boxes) for i in range(3)),
+        )
+
+    def is_bounded(self) -> bool:
+        return all(math.isfinite(c) for corner in self for c in corner)
+
+    def centroid(self) -> Tuple[float, float, float]:
+        return tuple((l + h) / 2 for l, h in zip(self.lo, self.hi))
+
+    def longest_axis(self) -> int:
+        extents = [h - l for l, h in zip(self.lo, self.hi)]
+        return extents.index(max(extents))
+
+
+INFINITE_AABB = AABB((-math.inf, -math.inf, -math.inf), (math.inf, math.inf, math.inf))
+
+
+# ---------- Helpers ----------
+
+def ray_aabb(O: tuple, D_inv: tuple, aabb: AABB, t_min: float, t_max: float) -> float:
+    """
+    Slab test: entry distance of the ray O + t*D into the box within [t_min, t_max],
+    or inf if it misses. D_inv holds 1/D per axis (inf for zero components).
+    """
+    lo, hi = aabb
+    for o, inv, l, h in zip(O, D_inv, lo, hi):
+        t1 = (l - o) * inv
+        t2 = (h - o) * inv
+        if t1 > t2:
+            t1, t2 = t2, t1
+        if t1 > t_min:
+            t_min = t1
+        if t2 < t_max:
+            t_max = t2
+        if t_min > t_max:
+            return math.inf
+    return t_min
+
+
+def closest_hit(objects: list, O, D, t_min: float, t_max: float, closest_t: float = float('inf'),
+                closest_obj=None) -> tuple:
+    """Linear scan over objects; returns the (t, obj) of the nearest hit in [t_min, t_max]."""
+    for obj in objects:
+        ts = obj.intersect(O, D)
+        if ts is None:
+            continue
+        for t in ts:
+            if t_min <= t <= t_max and t < closest_t:
+                closest_t = t
+                closest_obj = obj
+    return closest_t, closest_obj
+
+
+# ---------- BVH ----------
+
+class BVHNode:
+    """A BVH node: an AABB with either two children or a leaf list of objects."""
+    def __init__(self, aabb: AABB, left: 'BVHNode' = None, right: 'BVHNode' = None, objs: list = None):
+        self.aabb = aabb
+        self.left = left
+        self.right = right
+        self.objs = objs
+
+
+class BVH:
+    """
+    Bounding volume hierarchy over scene objects, built once top-down by splitting
+    each node at the centroid median along its longest centroid axis.
+    Objects without finite bounds (e.g. planes) form an always-hit leaf tested for every ray.
+    With LINEAR_SCAN_LIMIT or fewer bounded objects no tree is built and every object is scanned.
+    """
+    def __init__(self, objects: list):
+        self.objects = list(objects)
+        self.unbounded = []
+        self.root: Optional[BVHNode] = None
+
+        items = []
+        for obj in self.objects:
+            box = obj.bounds()
+            if box.is_bounded():
+                items.append((obj, box, box.centroid()))
+            else:
+                self.unbounded.append(obj)
+
+        if len(items) > LINEAR_SCAN_LIMIT:
+            self.root = self._build(items)
+
+    def _build(self, items: list) -> BVHNode:
+        aabb = AABB.union([box for _, box, _ in items])
+        if len(items) <= LEAF_SIZE:
+            return BVHNode(aabb, objs=[obj for obj, _, _ in items])
+
+        centroids = AABB.union([AABB(center, center) for _, _, center in items])
+        axis = centroids.longest_axis()
+        items.sort(key=lambda item: item[2][axis])
+        mid = len(items) // 2
+        return BVHNode(aabb, left=self._build(items[:mid]), right=self._build(items[mid:]))
+
+    def intersect(self, O, D, t_min: float, t_max: float) -> tuple:
+        """Return (t, obj) for the closest hit of O + t*D in [t_min, t_max], obj None on miss."""
+        if self.root is None:
+            return closest_hit(self.objects, O, D, t_min, t_max)
+
+        closest_t, closest_obj = closest_hit(self.unbounded, O, D, t_min, t_max)
+        origin = (O.x, O.y, O.z)
+        D_inv = tuple(1.0 / c if c else math.inf for c in (D.x, D.y, D.z))
+
+        # Explicit stack of (entry t, node); the nearer child is pushed last so it is visited first
+        stack = [(t_min, self.root)]
+        while stack:
+            entry, node = stack.pop()
+            if entry > closest_t:
+                continue  # a hit nearer than this whole box was found since it was pushed
+            if node.objs is not None:
+                closest_t, closest_obj = closest_hit(node.objs, O, D, t_min, t_max, closest_t, closest_obj)
+                continue
+
+            limit = min(t_max, closest_t)
+            t_left = ray_aabb(origin, D_inv, node.left.aabb, t_min, limit)
+            t_right = ray_aabb(origin, D_inv, node.right.aabb, t_min, limit)
+            if t_left <= t_right:
+                if t_right != math.inf:
+                    stack.append((t_right, node.right))
+                if t_left != math.inf:
+                    stack.append((t_left, node.left))
+            else:
+                if t_left != math.inf:
+                    stack.append((t_left, node.left))
+                stack.append((t_right, node.right))
+
+        return closest_t, closest_obj
+
+    def flatten(self) -> tuple:
+        """
+        Flatten the tree into arrays for compiled or GPU traversal, in depth-first order (root is node 0).
+        Returns (bounds, links, order): bounds[k] = (*lo, *hi); links[k] = (left, right, first, count),
+        with left = right = -1 for leaves, whose objects are order[first:first + count] (indices into
+        self.objects). Unbounded objects are not part of the tree and must be handled by the caller,
+        except in small scenes without a tree, where the single leaf holds every object.
+        """
+        index = {id(obj): i for i, obj in enumerate(self.objects)}
+        root = self.root
+        if root is None:  # small scene scanned linearly: one leaf with everything
+            root = BVHNode(AABB.union([obj.bounds() for obj in self.objects]), objs=self.objects)
+
+        bounds, links, order = [], [], []
+        stack = [(root, -1, 0)]  # (node, parent, child slot)
+        while stack:
+            node, parent, slot = stack.pop()
+            k = len(links)
+            if parent >= 0:
+                links[parent][slot] = k
+            bounds.append(node.aabb.lo + node.aabb.hi)
+            if node.objs is not None:
+                links.append([-1, -1, len(order), len(node.objs)])
+                order.extend(index[id(obj)] for obj in node.objs)
+            else:
+                links.append([-1, -1, 0, 0])
+                stack.append((node.right, k, 1))
+                stack.append((node.left, k, 0))
+        return bounds, links, order
@@ -1,22 +1,48 @@
+def validate_rgb(color):
+    """
+    Check that color is an (R, G, B) tuple of numbers.
+
+    Raises:
+        ValueError: if color is not a 3-tuple
+        TypeError: if a component is not int or float
+    """
+    if not isinstance(color, tuple) or len(color) != 3:
+        raise ValueError("Color must be a tuple of 3 integers (R, G, B).")
+    if not all(isinstance(c, (int, float)) for c in color):
+        raise TypeError("Each color component must be int or float.")
+
+
 def scale_rgb(color, scalar):
     """
-    Multiply an RGB tuple by a scalar and clamp each value to 255.
+    Multiply an RGB tuple by a scalar, round half up and clamp each value to 0..255.
+    Hot path: inputs are not validated (see scale_rgb_checked).
 
     Args:
         color: tuple of 3 integers (R, G, B)
         scalar: numeric multiplier
 
     Returns:
-        tuple of 3 integers (R, G, B) scaled and clamped to 255
+        tuple of 3 integers (R, G, B) scaled and clamped to 0..255
     """
-    if not isinstance(color, tuple) or len(color) != 3:
-        raise ValueError("Color must be a tuple of 3 integers (R, G, B).")
-    if not all(isinstance(c, (int, float)) for c in color):
-        raise TypeError("Each color component must be int or float.")
+    r = color[0] * scalar + 0.5
+    g = color[1] * scalar + 0.5
+    b = color[2] * scalar + 0.5
+    return (
+        255 if r >= 255 else int(r) if r > 0 else 0,
+        255 if g >= 255 else int(g) if g > 0 else 0,
+        255 if b >= 255 else int(b) if b > 0 else 0,
+    )
+
+
+def scale_rgb_checked(color, scalar):
+    """scale_rgb with argument validation, for use outside the per-pixel loop."""
+    validate_rgb(color)
     if not isinstance(scalar, (int, float)):
         raise TypeError("Scalar must be numeric.")
+    return scale_rgb(color, scalar)
 
-    return tuple(min(255, max(0, int(round(c * scalar)))) for c in color)
+_HEX = [f"{i:02x}" for i in range(256)]  # two-digit hex for every channel value
 
 def rgb_to_hex(color):
-    return "#%02x%02x%02x" % color
\ No newline at end of file
+    """Format an (R, G, B) tuple of ints in 0..255 as '#rrggbb' via a lookup table."""
+    return "#" + _HEX[color[0]] + _HEX[color[1]] + _HEX[color[2]]
@@ -0,0 +1,190 @@
+import math
+import numpy as np
+from numba import cuda
+from SceneObjects import Scene
+from RayKernels import scene_to_arrays, _lighting
+
+# ---------- GPU Renderer ----------
+#
+# One CUDA thread per pixel. The CPU builds the BVH (BoundingVolumes) and
+# flattens it; sphere, material, light and BVH arrays are copied to device
+# memory once per frame. Requires numba with a CUDA-capable GPU (or
+# NUMBA_ENABLE_CUDASIM=1 for the slow simulator).
+
+THREADS_PER_BLOCK = 256
+STACK_SIZE = 64    # BVH traversal stack per thread
+MAX_BOUNCES = 16   # local per-bounce arrays; max_depth must stay below this
+
+# Same shading code as the CPU kernels, compiled for the device
+_lighting_device = cuda.jit(device=True)(_lighting.py_func)
+
+
+def flatten_scene_bvh(scene: Scene) -> tuple:
+    """scene.bvh as device-ready arrays: (bvh_bounds (M, 6) float64, bvh_links (M, 4) int32, bvh_prims int32)."""
+    bounds, links, order = scene.bvh.flatten()
+    return (np.array(bounds, dtype=np.float64).reshape(-1, 6),
+            np.array(links, dtype=np.int32).reshape(-1, 4),
+            np.array(order, dtype=np.int32))
+
+
+@cuda.jit(device=True)
+def _slab_entry(ox, oy, oz, ix, iy, iz, bounds, k, t_min, t_max):
+    """Entry t of the ray into box k, or inf on a miss (see BoundingVolumes.ray_aabb)."""
+    t1 = (bounds[k, 0] - ox) * ix
+    t2 = (bounds[k, 3] - ox) * ix
+    t_min = max(t_min, min(t1, t2))
+    t_max = min(t_max, max(t1, t2))
+    t1 = (bounds[k, 1] - oy) * iy
+    t2 = (bounds[k, 4] - oy) * iy
+    t_min = max(t_min, min(t1, t2))
+    t_max = min(t_max, max(t1, t2))
+    t1 = (bounds[k, 2] - oz) * iz
+    t2 = (bounds[k, 5] - oz) * iz
+    t_min = max(t_min, min(t1, t2))
+    t_max = min(t_max, max(t1, t2))
+    return t_min if t_min <= t_max else math.inf
+
+
+@cuda.jit(device=True)
+def _closest_sphere_bvh(ox, oy, oz, dx, dy, dz, t_min, t_max, centers, radii,
+                        bvh_bounds, bvh_links, bvh_prims):
+    """Closest (t, sphere index) via the flattened BVH with a fixed-size stack; index -1 on miss."""
+    ix = 1.0 / dx if dx != 0.0 else math.inf
+    iy = 1.0 / dy if dy != 0.0 else math.inf
+    iz = 1.0 / dz if dz != 0.0 else math.inf
+    a = dx * dx + dy * dy + dz * dz
+
+    stack = cuda.local.array(STACK_SIZE, dtype=np.int32)
+    closest_t = math.inf
+    closest = -1
+    top = 0
+    if _slab_entry(ox, oy, oz, ix, iy, iz, bvh_bounds, 0, t_min, t_max) != math.inf:
+        stack[0] = 0
+        top = 1
+
+    while top > 0:
+        top -= 1
+        node = stack[top]
+        if _slab_entry(ox, oy, oz, ix, iy, iz, bvh_bounds, node, t_min, min(t_max, closest_t)) == math.inf:
+            continue
+
+        left = bvh_links[node, 0]
+        if left >= 0:
+            if top + 2 <= STACK_SIZE:
+                stack[top] = bvh_links[node, 1]
+                stack[top + 1] = left
+                top += 2
+            continue
+
+        first = bvh_links[node, 2]
+        for j in range(first, first + bvh_links[node, 3]):
+            i = bvh_prims[j]
+            cox = ox - centers[i, 0]
+            coy = oy - centers[i, 1]
+            coz = oz - centers[i, 2]
+            b = 2.0 * (dx * cox + dy * coy + dz * coz)
+            c = cox * cox + coy * coy + coz * coz - radii[i] * radii[i]
+            disc = b * b - 4.0 * a * c
+            if disc < 0.0:
+                continue
+            sqrt_disc = math.sqrt(disc)
+            t1 = (-b - sqrt_disc) / (2.0 * a)
+            t2 = (-b + sqrt_disc) / (2.0 * a)
+            if t_min <= t1 <= t_max and t1 < closest_t:
+                closest_t = t1
+                closest = i
+            if t_min <= t2 <= t_max and t2 < closest_t:
+                closest_t = t2
+                closest = i
+    return closest_t, closest
+
+
+@cuda.jit
+def trace_kernel(O, D, centers, radii, colors, spec, reflective, light_type, light_intensity, light_vec,
+                 bvh_bounds, bvh_links, bvh_prims, max_depth, out_img):
+    """
+    Trace ray i = cuda.grid(1) of the (N, 3) O/D batch into out_img[i] (uint8 RGB).
+    Iterative like RayKernels.trace_ray_nb: per-bounce colors are folded back-to-front.
+    """
+    i = cuda.grid(1)
+    if i >= D.shape[0]:
+        return
+
+    ox, oy, oz = O[i, 0], O[i, 1], O[i, 2]
+    dx, dy, dz = D[i, 0], D[i, 1], D[i, 2]
+    t_min = 1.0
+    local = cuda.local.array((MAX_BOUNCES, 3), dtype=np.int32)
+    refl = cuda.local.array(MAX_BOUNCES, dtype=np.float64)
+    n = 0
+    background = 0  # deep recursion
+
+    for depth in range(max_depth + 1):
+        t, k = _closest_sphere_bvh(ox, oy, oz, dx, dy, dz, t_min, math.inf, centers, radii,
+                                    bvh_bounds, bvh_links, bvh_prims)
+        if k < 0:
+            background = 255
+            break
+
+        px = ox + dx * t
+        py = oy + dy * t
+        pz = oz + dz * t
+        nx = px - centers[k, 0]
+        ny = py - centers[k, 1]
+        nz = pz - centers[k, 2]
+        length = math.sqrt(nx * nx + ny * ny + nz * nz)
+        if length > 0.0:
+            nx /= length
+            ny /= length
+            nz /= length
+
+        intensity = _lighting_device(px, py, pz, nx, ny, nz, -dx, -dy, -dz, spec[k],
+                                     light_type, light_intensity, light_vec)
+        for ch in range(3):
+            local[n, ch] = int(min(255.0, max(0.0, math.floor(colors[k, ch] * intensity + 0.5))))
+        refl[n] = reflective[k]
+        n += 1
+
+        if reflective[k] <= 0.0:
+            break
+
+        # Reflect D around N and offset to avoid self-intersection
+        d_dot_n = dx * nx + dy * ny + dz * nz
+        rx = dx - nx * 2.0 * d_dot_n
+        ry = dy - ny * 2.0 * d_dot_n
+        rz = dz - nz * 2.0 * d_dot_n
+        length = math.sqrt(rx * rx + ry * ry + rz * rz)
+        if length > 0.0:
+            rx /= length
+            ry /= length
+            rz /= length
+        ox = px + rx * 1e-4
+        oy = py + ry * 1e-4
+        oz = pz + rz * 1e-4
+        dx, dy, dz = rx, ry, rz
+
+    for ch in range(3):
+        c = background
+        for j in range(n - 1, -1, -1):
+            r = refl[j]
+            if r > 0.0:
+                w = int(r * 256)  # 8.8 fixed-point mix, as in trace_ray
+                c = (local[j, ch] * (256 - w) + c * w) >> 8
+            else:
+                c = local[j, ch]
+        out_img[i, ch] = c
+
+
+def trace_rays(O: np.ndarray, D: np.ndarray, scene: Scene, max_depth: int) -> np.ndarray:
+    """Trace an (N, 3) batch of rays of a sphere-only scene on the GPU. Returns (N, 3) uint8 colors."""
+    if max_depth >= MAX_BOUNCES:
+        raise ValueError(f"max_depth must be below MAX_BOUNCES ({MAX_BOUNCES}).")
+
+    arrays = scene_to_arrays(scene) + flatten_scene_bvh(scene)
+    device_arrays = [cuda.to_device(np.ascontiguousarray(a)) for a in arrays]
+    O_d = cuda.to_device(np.ascontiguousarray(O, dtype=np.float64))
+    D_d = cuda.to_device(np.ascontiguousarray(D, dtype=np.float64))
+    out_d = cuda.device_array((len(D), 3), dtype=np.uint8)
+
+    blocks = (len(D) + THREADS_PER_BLOCK - 1) // THREADS_PER_BLOCK
+    trace_kernel[blocks, THREADS_PER_BLOCK](O_d, D_d, *device_arrays, max_depth, out_d)
+    return out_d.copy_to_host()
@@ -0,0 +1,288 @@
+import math
+import numpy as np
+from numba import njit, prange
+from SceneObjects import Scene, Sphere, KIND_AMBIENT, KIND_POINT, KIND_DIRECTIONAL
+
+
+# ---------- Scene Flattening ----------
+
+def scene_to_arrays(scene: Scene) -> tuple:
+    """
+    Flatten a sphere-only scene into typed NumPy arrays for the compiled kernels.
+    Returns (centers, radii, colors, spec, reflective, light_type, light_intensity, light_vec).
+    """
+    spheres = scene.objects
+    if not all(isinstance(obj, Sphere) for obj in spheres):
+        raise TypeError("Compiled kernels only support scenes made of spheres.")
+
+    centers = np.array([(s.center.x, s.center.y, s.center.z) for s in spheres], dtype=np.float64).reshape(-1, 3)
+    radii = np.array([s.radius for s in spheres], dtype=np.float64)
+    colors = np.array([s.color for s in spheres], dtype=np.uint8).reshape(-1, 3)
+    spec = np.array([s.specular for s in spheres], dtype=np.float64)  # float so pow stays a libm call
+    reflective = np.array([s.reflective for s in spheres], dtype=np.float64)
+
+    lights = scene.lights
+    light_type = np.array([light.kind for light in lights], dtype=np.int8)
+    light_intensity = np.array([light.intensity for light in lights], dtype=np.float64)
+    light_vec = np.zeros((len(lights), 3), dtype=np.float64)
+    for i, light in enumerate(lights):
+        if light.kind == KIND_POINT:
+            light_vec[i] = (light.position.x, light.position.y, light.position.z)
+        elif light.kind == KIND_DIRECTIONAL:
+            light_vec[i] = (light.direction.x, light.direction.y, light.direction.z)
+
+    return centers, radii, colors, spec, reflective, light_type, light_intensity, light_vec
+
+
+# ---------- Kernels ----------
+
+@njit(cache=True, fastmath=True)
+def dot3(ax, ay, az, bx, by, bz):
+    """Dot product of two 3-vectors passed as scalars."""
+    return ax * bx + ay * by + az * bz
+
+
+@njit(cache=True, fastmath=True)
+def intersect_sphere(ox, oy, oz, dx, dy, dz, cx, cy, cz, r):
+    """
+    Roots (t1, t2) of |O + t*D - C|^2 = r^2 with t1 <= t2, or (-1, -1) when the ray misses.
+    The miss value is behind every ray rather than NaN, which fastmath is allowed to assume away.
+    """
+    cox = ox - cx
+    coy = oy - cy
+    coz = oz - cz
+    a = dot3(dx, dy, dz, dx, dy, dz)
+    b = 2.0 * dot3(dx, dy, dz, cox, coy, coz)
+    c = dot3(cox, coy, coz, cox, coy, coz) - r * r
+    disc = b * b - 4.0 * a * c
+    if disc < 0.0:
+        return -1.0, -1.0
+    sqrt_disc = math.sqrt(disc)
+    return (-b - sqrt_disc) / (2.0 * a), (-b + sqrt_disc) / (2.0 * a)
+
+
+@njit(cache=True, fastmath=True)
+def _closest_sphere(ox, oy, oz, dx, dy, dz, t_min, t_max, centers, radii):
+    """Return (closest_t, sphere_index) for one ray, index -1 on miss."""
+    closest_t = np.inf
+    closest = -1
+    for i in range(centers.shape[0]):
+        t1, t2 = intersect_sphere(ox, oy, oz, dx, dy, dz,
+                                  centers[i, 0], centers[i, 1], centers[i, 2], radii[i])
+        if t_min <= t1 <= t_max and t1 < closest_t:
+            closest_t = t1
+            closest = i
+        if t_min <= t2 <= t_max and t2 < closest_t:
+            closest_t = t2
+            closest = i
+    return closest_t, closest
+
+
+@njit(cache=True, fastmath=True)
+def _lighting(px, py, pz, nx, ny, nz, vx, vy, vz, s, light_type, light_intensity, light_vec):
+    """Scalar ComputeLighting: ambient + diffuse + specular, clamped to 1.0."""
+    intensity = 0.0
+    for i in range(light_type.shape[0]):
+        li = light_intensity[i]
+        if light_type[i] == KIND_AMBIENT:
+            intensity += li
+            if intensity >= 1.0:
+                return 1.0  # contributions are non-negative, so the clamp is already reached
+            continue
+
+        if light_type[i] == KIND_POINT:
+            lx = light_vec[i, 0] - px
+            ly = light_vec[i, 1] - py
+            lz = light_vec[i, 2] - pz
+            length = math.sqrt(lx * lx + ly * ly + lz * lz)
+            if length > 0.0:
+                lx /= length
+                ly /= length
+                lz /= length
+        else:
+            lx = light_vec[i, 0]
+            ly = light_vec[i, 1]
+            lz = light_vec[i, 2]
+
+        n_dot_l = nx * lx + ny * ly + nz * lz
+        if n_dot_l > 0.0:
+            intensity += li * n_dot_l
+
+        if s != -1.0:
+            rx = nx * (2.0 * n_dot_l) - lx
+            ry = ny * (2.0 * n_dot_l) - ly
+            rz = nz * (2.0 * n_dot_l) - lz
+            r_dot_v = rx * vx + ry * vy + rz * vz
+            if r_dot_v > 0.0:
+                intensity += li * math.pow(r_dot_v, s)
+
+        if intensity >= 1.0:
+            return 1.0
+
+    return intensity
+
+
+@njit(cache=True, fastmath=True)
+def _blend(local, refl, n, ch, background):
+    """Fold channel ch of the first n recorded bounces back-to-front, like the recursion."""
+    c = int(background)
+    for i in range(n - 1, -1, -1):
+        r = refl[i]
+        if r > 0.0:
+            w = int(r * 256)  # 8.8 fixed-point mix, as in trace_ray
+            c = (int(local[i, ch]) * (256 - w) + c * w) >> 8
+        else:
+            c = int(local[i, ch])
+    return c
+
+
+@njit(cache=True, fastmath=True)
+def _scratch(max_depth):
+    """Per-bounce (local colors, reflectivity) buffers for trace_ray_nb, allocated once per tile or row."""
+    return np.empty((max_depth + 1, 3)), np.empty(max_depth + 1)
+
+
+@njit(cache=True, fastmath=True)
+def trace_ray_nb(ox, oy, oz, dx, dy, dz, t_min, t_max, centers, radii, colors, spec, reflective,
+                 light_type, light_intensity, light_vec, max_depth, local, refl):
+    """
+    Iterative trace_ray for one ray; returns the (r, g, b) result.
+    Each bounce's local color is recorded in the caller's scratch buffers (see _scratch),
+    then blended back-to-front like the recursion.
+    """
+    n = 0
+    background = 0.0  # deep recursion
+
+    for depth in range(max_depth + 1):
+        t, k = _closest_sphere(ox, oy, oz, dx, dy, dz, t_min, t_max, centers, radii)
+        if k < 0:
+            background = 255.0
+            break
+
+        px = ox + dx * t
+        py = oy + dy * t
+        pz = oz + dz * t
+        nx = px - centers[k, 0]
+        ny = py - centers[k, 1]
+        nz = pz - centers[k, 2]
+        length = math.sqrt(nx * nx + ny * ny + nz * nz)
+        if length > 0.0:
+            nx /= length
+            ny /= length
+            nz /= length
+
+        intensity = _lighting(px, py, pz, nx, ny, nz, -dx, -dy, -dz, spec[k],
+                              light_type, light_intensity, light_vec)
+        for ch in range(3):
+            local[n, ch] = min(255.0, max(0.0, math.floor(colors[k, ch] * intensity + 0.5)))
+        refl[n] = reflective[k]
+        n += 1
+
+        if reflective[k] <= 0.0:
+            break
+
+        # Reflect D around N and offset to avoid self-intersection
+        d_dot_n = dot3(dx, dy, dz, nx, ny, nz)
+        rx = dx - nx * 2.0 * d_dot_n
+        ry = dy - ny * 2.0 * d_dot_n
+        rz = dz - nz * 2.0 * d_dot_n
+        length = math.sqrt(rx * rx + ry * ry + rz * rz)
+        if length > 0.0:
+            rx /= length
+            ry /= length
+            rz /= length
+        epsilon = 1e-4
+        ox = px + rx * epsilon
+        oy = py + ry * epsilon
+        oz = pz + rz * epsilon
+        dx, dy, dz = rx, ry, rz
+
+    return (_blend(local, refl, n, 0, background), _blend(local, refl, n, 1, background),
+            _blend(local, refl, n, 2, background))
+
+
+@njit(cache=True, fastmath=True)
+def _primary_ray(x, y, W, H, Vw, Vh, d):
+    """Unit direction from the origin through canvas pixel (x, y)."""
+    dx = (x - W / 2) * (Vw / W)
+    dy = (H / 2 - y) * (Vh / H)
+    dz = d
+    length = math.sqrt(dot3(dx, dy, dz, dx, dy, dz))
+    return dx / length, dy / length, dz / length
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def trace_image(H, W, Vw, Vh, d, centers, radii, colors, spec, reflective,
+                light_type, light_intensity, light_vec, max_depth):
+    """Trace every pixel of an H x W image from the origin. Returns an (H, W, 3) uint8 array."""
+    img = np.empty((H, W, 3), dtype=np.uint8)
+    for y in prange(H):
+        local, refl = _scratch(max_depth)  # one set per row, the unit of parallel work
+        for x in range(W):
+            dx, dy, dz = _primary_ray(x, y, W, H, Vw, Vh, d)
+            r, g, b = trace_ray_nb(0.0, 0.0, 0.0, dx, dy, dz, 1.0, np.inf,
+                                   centers, radii, colors, spec, reflective,
+                                   light_type, light_intensity, light_vec, max_depth, local, refl)
+            img[y, x, 0] = r
+            img[y, x, 1] = g
+            img[y, x, 2] = b
+    return img
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def trace_tile(x0, y0, x1, y1, W, H, Vw, Vh, d, centers, radii, colors, spec, reflective,
+               light_type, light_intensity, light_vec, max_depth):
+    """
+    Trace the [x0, x1) x [y0, y1) tile of an H x W image on one thread.
+    Returns a (y1-y0, x1-x0, 3) uint8 array. Parallelism comes from the caller's pool.
+    """
+    pixels = np.empty((y1 - y0, x1 - x0, 3), dtype=np.uint8)
+    local, refl = _scratch(max_depth)
+    for y in range(y0, y1):
+        for x in range(x0, x1):
+            dx, dy, dz = _primary_ray(x, y, W, H, Vw, Vh, d)
+            r, g, b = trace_ray_nb(0.0, 0.0, 0.0, dx, dy, dz, 1.0, np.inf,
+                                   centers, radii, colors, spec, reflective,
+                                   light_type, light_intensity, light_vec, max_depth, local, refl)
+            pixels[y - y0, x - x0, 0] = r
+            pixels[y - y0, x - x0, 1] = g
+            pixels[y - y0, x - x0, 2] = b
+    return pixels
+
+
+# No fastmath here: this feeds the NumPy renderer, whose output matches the
+# scalar tracer bit for bit, and FMA contraction flips hits on grazing rays.
+@njit(cache=True, parallel=True)
+def intersect_all_spheres(O, D, cx, cy, cz, r, t_min, t_max, out_t, out_idx, ids):
+    """
+    Closest sphere hit for every ray of a batch, in place (same contract as
+    _sphere_core.trace_scene_c): out_t/out_idx hold the current nearest hit and are
+    only lowered; ids maps sphere k to its object index. Spheres are SoA arrays.
+    """
+    for i in prange(D.shape[0]):
+        ox, oy, oz = O[i, 0], O[i, 1], O[i, 2]
+        dx, dy, dz = D[i, 0], D[i, 1], D[i, 2]
+        a = dx * dx + dy * dy + dz * dz
+        best = out_t[i]
+        best_k = -1
+        for k in range(cx.shape[0]):
+            cox = ox - cx[k]
+            coy = oy - cy[k]
+            coz = oz - cz[k]
+            b = 2.0 * (dx * cox + dy * coy + dz * coz)
+            c = cox * cox + coy * coy + coz * coz - r[k] * r[k]
+            disc = b * b - 4.0 * a * c
+            if disc < 0.0:
+                continue
+            sqrt_disc = math.sqrt(disc)
+            t1 = (-b - sqrt_disc) / (2.0 * a)
+            t2 = (-b + sqrt_disc) / (2.0 * a)
+            if t_min <= t1 <= t_max and t1 < best:
+                best = t1
+                best_k = k
+            elif t_min <= t2 <= t_max and t2 < best:
+                best = t2
+                best_k = k
+        if best_k >= 0:
+            out_t[i] = best
+            out_idx[i] = ids[best_k]
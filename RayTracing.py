@@ -1,16 +1,45 @@
+import math
+import os
+import pickle
+import sys
+import tkinter
+import numpy as np
 from graphics import GraphWin
-from SceneObjects import Scene
+from SceneObjects import Scene, Sphere, KIND_AMBIENT, KIND_POINT, _sphere_core
 from VectorUtilities import Vector
-from ColorUtilities import scale_rgb, rgb_to_hex
-from concurrent.futures import ThreadPoolExecutor
+from ColorUtilities import scale_rgb
+
+try:
+    from RayKernels import intersect_all_spheres  # optional, needs numba
+except ImportError:
+    intersect_all_spheres = None
 
 # ---------- Ray Tracer Core ----------
 
+VIEWPORT = (1.0, 1.0, 1.0)  # (Vw, Vh, d): viewport width, height and distance, shared by every renderer
+
+
 def canvas_to_viewport(x: float, y: float, Vw: float, Vh: float, d: float, Cw: int, Ch: int) -> tuple:
-    """Convert canvas coordinates to viewport coordinates."""
+    """Convert one canvas coordinate to viewport coordinates (renderers use _viewport_directions)."""
     return Vector(x * Vw / Cw, y * Vh / Ch, d)
 
 
+def _viewport_directions(width: int, height: int, Vw: float, Vh: float, d: float,
+                         rows: range = None, cols: range = None) -> np.ndarray:
+    """
+    Build the normalized (len(rows)*len(cols), 3) array of primary ray directions, row-major.
+    The canvas-to-viewport scale is computed once; rows and cols default to the full image.
+    """
+    rows = np.arange(height) if rows is None else np.asarray(rows)
+    cols = np.arange(width) if cols is None else np.asarray(cols)
+    xs = (cols - width / 2) * (Vw / width)
+    ys = (height / 2 - rows) * (Vh / height)
+    X, Y = np.meshgrid(xs, ys)
+    D = np.stack((X, Y, np.full_like(X, d)), -1).reshape(-1, 3)
+    D /= np.linalg.norm(D, axis=1, keepdims=True)
+    return D
+
+
 MAX_DEPTH = 3  # maximum recursion depth
 
 def reflect(D: Vector, N: Vector) -> Vector:
@@ -18,138 +47,610 @@ def reflect(D: Vector, N: Vector) -> Vector:
     return D - N * 2 * D.dot(N)
 
 
+def _normalize3(x: float, y: float, z: float) -> tuple:
+    """Normalize a vector given as scalars; returns a plain (x, y, z) tuple."""
+    length = math.sqrt(x * x + y * y + z * z)
+    if length == 0:
+        return (0.0, 0.0, 0.0)
+    return (x / length, y / length, z / length)
+
+
 def trace_ray(O: Vector, D: Vector, t_min: float, t_max: float, scene: Scene, depth: int = 0) -> tuple:
     """
     Trace a ray from origin O along direction D through the scene.
     Returns an RGB color tuple.
     Supports diffuse, specular, and reflective surfaces.
+    Vectors are only built at the object API boundary; shading runs on scalars.
     """
     if depth > MAX_DEPTH:
         return (0, 0, 0)  # background for deep recursion
 
     # Find closest intersection
-    closest_t = float('inf')
-    closest_obj = None
-
-    for obj in scene.objects:
-        ts = obj.intersect(O, D)
-        if ts is None:
-            continue
-        for t in ts:
-            if t_min <= t <= t_max and t < closest_t:
-                closest_t = t
-                closest_obj = obj
+    compiled = scene.compiled
+    if compiled is not None:
+        closest_t, closest_obj = compiled.closest(O, D, t_min, t_max)
+    else:
+        closest_t, closest_obj = scene.intersect(O, D, t_min, t_max)
 
     if closest_obj is None:
         return (255, 255, 255)  # background color
 
+    dx, dy, dz = D.x, D.y, D.z
     # Intersection point
-    P = O + D * closest_t
+    px = O.x + dx * closest_t
+    py = O.y + dy * closest_t
+    pz = O.z + dz * closest_t
     # Surface normal
-    N = closest_obj.normal_at(P)
-    # View vector (towards camera)
-    V = -D
-    # Local lighting (diffuse + specular)
-    intensity = ComputeLighting(P, N, scene, V, closest_obj.specular)
+    N = closest_obj.normal_at(Vector._make(px, py, pz))
+    nx, ny, nz = N.x, N.y, N.z
+    # Local lighting (diffuse + specular), view vector is -D
+    if compiled is not None:
+        intensity = compiled.lighting(px, py, pz, nx, ny, nz, -dx, -dy, -dz, closest_obj.specular)
+    else:
+        intensity = _lighting(px, py, pz, nx, ny, nz, -dx, -dy, -dz, scene.lights, closest_obj.specular)
     local_color = scale_rgb(closest_obj.color, intensity)
 
     # Handle reflection
-    reflective = getattr(closest_obj, "reflective", 0.0)
+    reflective = closest_obj.reflective
     if reflective > 0:
-        R = reflect(D, N).normalize()
+        d_dot_n = dx * nx + dy * ny + dz * nz
+        rx, ry, rz = _normalize3(dx - nx * 2 * d_dot_n, dy - ny * 2 * d_dot_n, dz - nz * 2 * d_dot_n)
         # Small offset to avoid self-intersection
         epsilon = 1e-4
-        reflected_color = trace_ray(P + R * epsilon, R, t_min, t_max, scene, depth + 1)
-        # Mix colors
-        local_color = tuple(
-            int(local_color[i] * (1 - reflective) + reflected_color[i] * reflective)
-            for i in range(3)
+        reflected_origin = Vector._make(px + rx * epsilon, py + ry * epsilon, pz + rz * epsilon)
+        reflected_color = trace_ray(reflected_origin, Vector._make(rx, ry, rz), t_min, t_max, scene, depth + 1)
+        # Mix colors in 8.8 fixed point: (local * (256 - w) + reflected * w) >> 8
+        w = int(reflective * 256)
+        iw = 256 - w
+        local_color = (
+            (local_color[0] * iw + reflected_color[0] * w) >> 8,
+            (local_color[1] * iw + reflected_color[1] * w) >> 8,
+            (local_color[2] * iw + reflected_color[2] * w) >> 8,
         )
 
     return local_color
 
 
-def ComputeLighting(P: Vector, N: Vector, scene: Scene, V: Vector, s: int) -> float:
-    """
-    Compute the lighting intensity at a point with normal N and view vector V.
-    Includes ambient, diffuse, and specular components.
-    """
+def _lighting(px: float, py: float, pz: float, nx: float, ny: float, nz: float,
+              vx: float, vy: float, vz: float, lights: list, s: int) -> float:
+    """Scalar core of ComputeLighting: point, normal and view vector passed as components."""
     intensity = 0.0
 
-    for light in scene.lights:
-        if light.type == "ambient":
+    for light in lights:
+        kind = light.kind
+        if kind == KIND_AMBIENT:
             intensity += light.intensity
+            if intensity >= 1.0:
+                return 1.0  # contributions are non-negative, so the clamp is already reached
             continue
 
         # Determine light direction
-        if light.type == "point":
-            L = (light.position - P).normalize()
-        else:  # directional
-            L = light.direction.normalize()
+        if kind == KIND_POINT:
+            position = light.position
+            lx, ly, lz = _normalize3(position.x - px, position.y - py, position.z - pz)
+        else:  # directional, already unit length
+            direction = light.direction
+            lx, ly, lz = direction.x, direction.y, direction.z
 
         # Diffuse component
-        n_dot_l = N.dot(L)
+        n_dot_l = nx * lx + ny * ly + nz * lz
         if n_dot_l > 0:
             intensity += light.intensity * n_dot_l
 
         # Specular component
         if s != -1:
-            R = N * (2 * n_dot_l) - L
-            r_dot_v = R.dot(V)
+            k = 2 * n_dot_l
+            r_dot_v = (nx * k - lx) * vx + (ny * k - ly) * vy + (nz * k - lz) * vz
             if r_dot_v > 0:
+                # float ** int is a single C pow() call; a Python-level
+                # square-and-multiply loop is ~10x slower even for s=500
                 intensity += light.intensity * (r_dot_v ** s)
 
-    return min(1.0, intensity)  # Clamp to 1.0
+        if intensity >= 1.0:
+            return 1.0
 
+    return intensity
 
-# ---------- Renderer ----------
 
-def render_row(y: int, width: int, height: int, origin: tuple, Vw: float, Vh: float, d: float, scene: Scene) -> tuple:
+def ComputeLighting(P: Vector, N: Vector, scene: Scene, V: Vector, s: int) -> float:
     """
-    Render a single row of pixels and return the list of color hex values.
+    Compute the lighting intensity at a point with normal N and view vector V.
+    Includes ambient, diffuse, and specular components.
     """
-    row_colors = []
-    y_canvas = height / 2 - y
+    return _lighting(P.x, P.y, P.z, N.x, N.y, N.z, V.x, V.y, V.z, scene.lights, s)
 
-    for x in range(width):
-        x_canvas = x - width / 2
-        direction = canvas_to_viewport(x_canvas, y_canvas, Vw, Vh, d, width, height).normalize()
-        color = trace_ray(origin, direction, 1.0, float('inf'), scene)
-        row_colors.append(rgb_to_hex(color))
 
-    return (y, row_colors)
+# ---------- Renderer ----------
 
 def render_sequential(win: GraphWin, width: int, height: int, scene: Scene):
-    """Sequential renderer for testing or small images."""
+    """
+    Sequential renderer for testing or small images.
+    Pixels go into a uint8 frame buffer that is blitted once with draw_image,
+    instead of a hex string and a win.plot call per pixel.
+    """
     origin = Vector(0, 0, 0)
-    Vw, Vh, d = 1.0, 1.0, 1.0
+    Vw, Vh, d = VIEWPORT
+    scene.refresh()
+
+    directions = _viewport_directions(width, height, Vw, Vh, d).reshape(height, width, 3).tolist()
+
+    image = np.empty((height, width, 3), dtype=np.uint8)  # frame buffer
+    for y, row in enumerate(directions):
+        image[y] = [trace_ray(origin, Vector._make(dx, dy, dz), 1.0, float('inf'), scene) for dx, dy, dz in row]
+
+    draw_image(win, image)
+
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
 
-    for y in range(height):
-        y_canvas = height / 2 - y
-        for x in range(width):
-            x_canvas = x - width / 2
-            direction = canvas_to_viewport(x_canvas, y_canvas, Vw, Vh, d, width, height).normalize()
-            color = trace_ray(origin, direction, 1.0, float('inf'), scene)
-            win.plot(x, y, rgb_to_hex(color))
+TILE_WIDTH, TILE_HEIGHT = 32, 32  # default work unit for the pool
 
-from concurrent.futures import ProcessPoolExecutor, as_completed
+# Per-process state of pool workers; the thread pool passes its scene and frame explicitly
+_worker_scene = None   # scene unpickled once per worker process
+_worker_frame = None   # (H, W, 3) uint8 frame buffer in shared memory that tiles are written into
+_worker_shm = None     # shared memory backing _worker_frame
 
-def render_parallel_rows(win: GraphWin, width: int, height: int, scene: Scene, max_workers: int = None):
-    """Render the scene using parallel row processing (compute first, draw later)."""
+
+def _kernel_arrays(scene: Scene):
+    """scene_to_arrays(scene) if numba is installed and the scene is sphere-only, else None."""
+    try:
+        from RayKernels import scene_to_arrays
+        return scene_to_arrays(scene)
+    except (ImportError, TypeError):
+        return None
+
+
+def _worker_init(scene_bytes: bytes, shm_name: str, shape: tuple):
+    """Process-pool initializer: unpickle the scene once and attach to the shared frame buffer."""
+    global _worker_scene, _worker_frame, _worker_shm
+    _worker_shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_scene = pickle.loads(scene_bytes)
+    _worker_frame = np.ndarray(shape, dtype=np.uint8, buffer=_worker_shm.buf)
+
+
+def _worker_tile(tile: tuple):
+    """
+    Process-pool task: render one tile of the worker's scene into the shared frame buffer.
+    Only scenes the Numba kernel cannot trace reach a process pool, so there are no kernel arrays.
+    """
+    render_tile(_worker_scene, None, _worker_frame, tile)
+
+
+def _pool_context():
+    """
+    Start method for the process pool: forkserver where available, else spawn.
+    Forking a process whose Numba parallel kernels have already started their
+    threading layer (render_numpy, render_numba) leaves the interpreter hung at exit.
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload([__name__])  # best effort: workers then fork with it imported
+    return context
+
+
+def _gil_enabled() -> bool:
+    """True unless running on a free-threaded CPython (3.13t+) with the GIL disabled."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled() if is_gil_enabled else True
+
+
+def render_tile(scene: Scene, arrays, frame: np.ndarray, tile: tuple):
+    """
+    Render one (x0, y0, x1, y1, width, height) tile of the scene
+    straight into its rows and columns of the frame buffer.
+    arrays is the scene's _kernel_arrays: when given, the Numba kernel traces the tile.
+    """
+    x0, y0, x1, y1, width, height = tile
     origin = Vector(0, 0, 0)
-    Vw, Vh, d = 1.0, 1.0, 1.0
+    Vw, Vh, d = VIEWPORT
+    pixels = frame[y0:y1, x0:x1]
+
+    if arrays is not None:
+        from RayKernels import trace_tile
+        pixels[...] = trace_tile(x0, y0, x1, y1, width, height, Vw, Vh, d, *arrays, MAX_DEPTH)
+        return
+
+    directions = _viewport_directions(width, height, Vw, Vh, d, rows=range(y0, y1), cols=range(x0, x1))
+    directions = directions.reshape(y1 - y0, x1 - x0, 3).tolist()
+
+    for ty, row in enumerate(directions):
+        for tx, (dx, dy, dz) in enumerate(row):
+            pixels[ty, tx] = trace_ray(origin, Vector._make(dx, dy, dz), 1.0, float('inf'), scene)
+
 
-    row_results = [None] * height  # preallocate buffer for rows
+def render_parallel_rows(win: GraphWin, width: int, height: int, scene: Scene, max_workers: int = None,
+                         tile_size: tuple = (TILE_WIDTH, TILE_HEIGHT)):
+    """
+    Render the scene in parallel tiles (compute first, draw later).
+    The scene is shipped to each worker once; tiles are handed out dynamically
+    so slow, object-dense regions do not hold up the rest of the image.
+    Workers write their tiles directly into one frame buffer, which lives in
+    shared memory for a process pool, so no pixels travel back through pickling.
+    Pure-Python tracing holds the GIL, so threads are only used when the GIL is
+    disabled or the tiles run in the nogil Numba kernel; otherwise a process pool is used.
+    """
+    tile_w, tile_h = tile_size
+    tiles = [
+        (x0, y0, min(x0 + tile_w, width), min(y0 + tile_h, height), width, height)
+        for y0 in range(0, height, tile_h)
+        for x0 in range(0, width, tile_w)
+    ]
+    scene.refresh()
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(tiles) // (workers * 8))
+
+    image = np.empty((height, width, 3), dtype=np.uint8)  # frame buffer
+    arrays = _kernel_arrays(scene)
+    use_threads = arrays is not None or not _gil_enabled()
+    scene_bytes = None if use_threads else pickle.dumps(scene)  # before any shared memory exists
+    shm = None
 
     # Phase 1: parallel computation
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(render_row, y, width, height, origin, Vw, Vh, d, scene): y for y in range(height)}
+    try:
+        if use_threads:
+            # Threads write straight into image; nothing outlives this call
+            executor = ThreadPoolExecutor(max_workers=max_workers)
+            task = functools.partial(render_tile, scene, arrays, image)
+        else:
+            shm = shared_memory.SharedMemory(create=True, size=max(1, image.nbytes))
+            executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=_pool_context(),
+                                           initializer=_worker_init,
+                                           initargs=(scene_bytes, shm.name, image.shape))
+            task = _worker_tile
+        with executor:
+            for _ in executor.map(task, tiles, chunksize=chunksize):
+                pass  # results are in the frame buffer; iterating re-raises worker errors
+        if shm is not None:
+            image[...] = np.ndarray(image.shape, dtype=np.uint8, buffer=shm.buf)
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+    # Phase 2: one bulk upload of the whole frame
+    draw_image(win, image)
+
+
+# ---------- Vectorized Renderer ----------
+
+def _nearest_root(result: tuple, t_min: float, t_max: float) -> np.ndarray:
+    """Reduce an intersect_batch result (*t_arrays, hit_mask) to the nearest in-range t per ray (inf on miss)."""
+    *roots, hit = result
+    t_near = np.full(len(hit), np.inf)
+    for t in roots:
+        valid = hit & (t >= t_min) & (t <= t_max) & (t < t_near)
+        t_near[valid] = t[valid]
+    return t_near
+
+
+RAY_CHUNK = 8192  # rays per packet in the vectorized closest-hit loop
+# Ray and hit buffers of the vectorized renderer. np.float64 matches trace_ray exactly;
+# np.float32 halves the buffers, but its hits must be refined in float64 before shading
+DTYPE = np.float64
+
+
+def _spread_bits(q: np.ndarray) -> np.ndarray:
+    """Spread the low 10 bits of q so they occupy every third bit (Morton interleave)."""
+    q = (q | (q << 16)) & 0x030000FF
+    q = (q | (q << 8)) & 0x0300F00F
+    q = (q | (q << 4)) & 0x030C30C3
+    q = (q | (q << 2)) & 0x09249249
+    return q
+
+
+def reorder_rays(D: np.ndarray) -> np.ndarray:
+    """
+    Permutation sorting rays by a 30-bit Morton key of their direction.
+    Secondary rays scatter; grouping similar directions keeps each RAY_CHUNK
+    packet coherent, so more spheres are culled per packet in _closest_hits.
+    """
+    q = np.clip(((D + 1.0) * 511.5).astype(np.uint32), 0, 1023)
+    key = (_spread_bits(q[:, 0]) << 2) | (_spread_bits(q[:, 1]) << 1) | _spread_bits(q[:, 2])
+    return np.argsort(key, kind='stable')
 
-        for future in as_completed(futures):
-            y, row_colors = future.result()
-            row_results[y] = row_colors  # store in buffer at correct index
 
-    # Phase 2: sequential drawing
-    for y, row_colors in enumerate(row_results):
-        for x, color_hex in enumerate(row_colors):
-            win.plot(x, y, color_hex)
+def _sphere_packets(scene: Scene) -> bool:
+    """
+    True if _intersect_spheres streams the scene's spheres in culled RAY_CHUNK packets,
+    the only place ray order matters. The Numba and Cython kernels test rays one at a time.
+    """
+    return bool(scene.spheres) and intersect_all_spheres is None and _sphere_core is None
+
+
+def _intersect_spheres(O: np.ndarray, D: np.ndarray, t_min: float, t_max: float, scene: Scene,
+                       closest_t: np.ndarray, closest_idx: np.ndarray):
+    """
+    Lower closest_t/closest_idx in place with the scene's spheres.
+    Uses the Numba kernel, else the Cython extension, when available.
+    Otherwise rays are streamed in RAY_CHUNK packets with spheres as the inner loop, so
+    each packet stays in cache while sphere data is reused across it. A sphere
+    is skipped for a packet once every ray already has a hit nearer than the
+    sphere can possibly be (|O - C| - r).
+    """
+    if intersect_all_spheres is not None:
+        # Numba kernel: SoA sphere arrays in the ray dtype, rays spread over all cores
+        cx, cy, cz = scene.sphere_xyz.astype(D.dtype)
+        intersect_all_spheres(np.ascontiguousarray(O), np.ascontiguousarray(D), cx, cy, cz,
+                              scene.sphere_radii.astype(D.dtype), t_min, t_max, closest_t, closest_idx,
+                              scene.sphere_ids)
+        return
+    if _sphere_core is not None:
+        # Compiled extension (float64 only): one call covers every ray and sphere
+        t64 = closest_t.astype(np.float64)
+        _sphere_core.trace_scene_c(np.ascontiguousarray(O, dtype=np.float64), np.ascontiguousarray(D, dtype=np.float64),
+                                   scene.sphere_centers, scene.sphere_r2, t_min, t_max, t64, closest_idx,
+                                   scene.sphere_ids)
+        closest_t[:] = t64
+        return
+
+    centers, radii = scene.sphere_centers.astype(D.dtype), scene.sphere_radii.astype(D.dtype)
+    # Visit spheres nearest-first (from the batch's mean origin) so packets resolve early
+    order = np.argsort(np.linalg.norm(centers - O.mean(axis=0), axis=1) - radii)
+
+    for start in range(0, len(D), RAY_CHUNK):
+        O_chunk = O[start:start + RAY_CHUNK]
+        D_chunk = D[start:start + RAY_CHUNK]
+        t_chunk = closest_t[start:start + RAY_CHUNK]    # views, updated in place
+        idx_chunk = closest_idx[start:start + RAY_CHUNK]
+
+        for k in order:
+            i, sphere = scene.spheres[k]
+            CO = O_chunk - centers[k]
+            co2 = np.einsum('ij,ij->i', CO, CO)
+            if (t_chunk <= np.sqrt(co2) - radii[k]).all():
+                continue  # packet already resolved in front of this sphere
+            t = _nearest_root(sphere.intersect_batch(O_chunk, D_chunk), t_min, t_max)
+            closer = t < t_chunk
+            t_chunk[closer] = t[closer]
+            idx_chunk[closer] = i
+
+
+def _intersect_planes(O: np.ndarray, D: np.ndarray, t_min: float, t_max: float, scene: Scene,
+                      closest_t: np.ndarray, closest_idx: np.ndarray):
+    """Lower closest_t/closest_idx in place with the scene's planes, from their SoA arrays."""
+    points, normals = scene.plane_points.astype(D.dtype), scene.plane_normals.astype(D.dtype)
+    for i, point, normal in zip(scene.plane_ids, points, normals):
+        denom = np.einsum('ij,j->i', D, normal)
+        facing = np.abs(denom) >= 1e-6  # branch-free, as in Plane.intersect_batch
+        t = np.einsum('ij,j->i', point - O, normal) / np.where(facing, denom, 1e30)
+        closer = facing & (t >= 0) & (t >= t_min) & (t <= t_max) & (t < closest_t)
+        closest_t[closer] = t[closer]
+        closest_idx[closer] = i
+
+
+def _closest_hits(O: np.ndarray, D: np.ndarray, t_min: float, t_max: float, scene: Scene) -> tuple:
+    """
+    Intersect a batch of rays with every object in the scene, one object type at a time
+    (see Scene.partition). Returns (closest_t, closest_idx); closest_idx is -1 where nothing was hit.
+    """
+    closest_t = np.full(len(D), np.inf, dtype=D.dtype)
+    closest_idx = np.full(len(D), -1, dtype=np.intp)
+
+    if scene.spheres:
+        _intersect_spheres(O, D, t_min, t_max, scene, closest_t, closest_idx)
+    if scene.planes:
+        _intersect_planes(O, D, t_min, t_max, scene, closest_t, closest_idx)
+
+    for i, obj in scene.cylinders + scene.tori + scene.others:
+        t = _nearest_root(obj.intersect_batch(O, D), t_min, t_max)
+        closer = t < closest_t
+        closest_t[closer] = t[closer]
+        closest_idx[closer] = i
+
+    return closest_t, closest_idx
+
+
+def _refine_hits(O: np.ndarray, D: np.ndarray, t: np.ndarray, idx: np.ndarray, t_min: float, t_max: float,
+                 scene: Scene) -> np.ndarray:
+    """
+    Recompute reduced-precision hit distances in float64, against only the object each ray hit.
+    normal_at's cap and edge tests (1e-6) are tighter than float32 distances resolve.
+    Grazing rays whose float64 root falls out of range keep their original t.
+    """
+    for i in np.unique(idx):
+        mask = idx == i
+        t_i = _nearest_root(scene.objects[i].intersect_batch(O[mask], D[mask]), t_min, t_max)
+        t[mask] = np.where(np.isfinite(t_i), t_i, t[mask])
+    return t
+
+
+def _normals(P: np.ndarray, idx: np.ndarray, scene: Scene) -> np.ndarray:
+    """Surface normals at hit points P, where idx[i] is the object hit by ray i."""
+    N = np.empty_like(P)
+    for i in np.unique(idx):
+        mask = idx == i
+        obj = scene.objects[i]
+        if isinstance(obj, Sphere):
+            V = P[mask] - np.array([obj.center.x, obj.center.y, obj.center.z])
+            N[mask] = V / np.linalg.norm(V, axis=1, keepdims=True)
+        else:
+            normals = [obj.normal_at(Vector._make(*p)) for p in P[mask].tolist()]
+            N[mask] = [(n.x, n.y, n.z) for n in normals]
+    return N
+
+
+def _compute_lighting_batch(P: np.ndarray, N: np.ndarray, scene: Scene, V: np.ndarray, s: np.ndarray) -> np.ndarray:
+    """Vectorized ComputeLighting: one intensity per hit point, clamped to 1.0."""
+    intensity = np.zeros(len(P))
+    has_specular = s != -1
+
+    for light in scene.lights:
+        if light.kind == KIND_AMBIENT:
+            intensity += light.intensity
+            continue
+
+        if light.kind == KIND_POINT:
+            L = np.array([light.position.x, light.position.y, light.position.z]) - P
+            length = np.linalg.norm(L, axis=1, keepdims=True)
+            L = L / np.where(length == 0, 1.0, length)
+        else:  # directional, already unit length
+            L = np.broadcast_to(np.array([light.direction.x, light.direction.y, light.direction.z]), P.shape)
+
+        # Diffuse component
+        n_dot_l = np.einsum('ij,ij->i', N, L)
+        intensity += light.intensity * np.maximum(0, n_dot_l)
+
+        # Specular component
+        R = N * (2 * n_dot_l)[:, None] - L
+        r_dot_v = np.einsum('ij,ij->i', R, V)
+        mask = has_specular & (r_dot_v > 0)
+        intensity[mask] += light.intensity * np.power(r_dot_v[mask], s[mask])
+
+    return np.minimum(1.0, intensity)
+
+
+def _material_tables(scene: Scene) -> tuple:
+    """Per-object (colors, specular, reflective) lookup arrays, indexed by closest_idx."""
+    return (
+        np.array([obj.color for obj in scene.objects], dtype=float),
+        np.array([obj.specular for obj in scene.objects]),
+        np.array([obj.reflective for obj in scene.objects], dtype=float),
+    )
+
+
+def _trace_batch(O: np.ndarray, D: np.ndarray, t_min: float, t_max: float, scene: Scene, depth: int = 0,
+                 tables: tuple = None) -> np.ndarray:
+    """
+    Vectorized trace_ray over a batch of rays (O and D are (N, 3) arrays).
+    Returns an (N, 3) float array of RGB colors.
+    tables are the scene's _material_tables, built once and passed down the recursion.
+    """
+    if depth > MAX_DEPTH:
+        return np.zeros((len(D), 3))  # background for deep recursion
+
+    colors = np.full((len(D), 3), 255.0)  # background color
+    closest_t, closest_idx = _closest_hits(O, D, t_min, t_max, scene)
+    hit = closest_idx >= 0
+    if not hit.any():
+        return colors
+
+    # Shading runs in float64 whatever DTYPE the intersection buffers use
+    idx = closest_idx[hit]
+    O_hit = O[hit].astype(np.float64)
+    D_hit = D[hit].astype(np.float64)
+    t_hit = closest_t[hit].astype(np.float64)
+    if D.dtype != np.float64:
+        t_hit = _refine_hits(O_hit, D_hit, t_hit, idx, t_min, t_max, scene)
+    P = O_hit + D_hit * t_hit[:, None]
+    N = _normals(P, idx, scene)
+
+    if tables is None:
+        tables = _material_tables(scene)
+    obj_colors, specular, reflective = tables
+
+    intensity = _compute_lighting_batch(P, N, scene, -D_hit, specular[idx])
+    local_color = np.clip(np.floor(obj_colors[idx] * intensity[:, None] + 0.5), 0, 255)  # as scale_rgb
+
+    # Handle reflection for the subset of hits on reflective surfaces
+    r = reflective[idx]
+    mirror = r > 0
+    if mirror.any():
+        Dm, Nm = D_hit[mirror], N[mirror]
+        R = Dm - Nm * (2 * np.einsum('ij,ij->i', Dm, Nm))[:, None]
+        R /= np.linalg.norm(R, axis=1, keepdims=True)
+        epsilon = 1e-4
+        Om = (P[mirror] + R * epsilon).astype(D.dtype)
+        R = R.astype(D.dtype)
+        if len(R) > RAY_CHUNK and _sphere_packets(scene):
+            # Spans several culled packets: trace in coherent order, then scatter back
+            p = reorder_rays(R)
+            reflected_color = np.empty((len(R), 3))
+            reflected_color[p] = _trace_batch(Om[p], R[p], t_min, t_max, scene, depth + 1, tables)
+        else:
+            reflected_color = _trace_batch(Om, R, t_min, t_max, scene, depth + 1, tables)
+        # Same 8.8 fixed-point mix as trace_ray
+        w = (r[mirror] * 256).astype(np.int64)[:, None]
+        mixed = (local_color[mirror].astype(np.int64) * (256 - w) + reflected_color.astype(np.int64) * w) >> 8
+        local_color[mirror] = mixed
+
+    colors[hit] = local_color
+    return colors
+
+
+def render_numpy(width: int, height: int, scene: Scene) -> np.ndarray:
+    """
+    Render the whole image as one vectorized NumPy batch.
+    Objects are intersected through intersect_batch (vectorized for spheres,
+    a per-ray loop over intersect otherwise). Returns an (H, W, 3) uint8 image.
+    """
+    scene.refresh()
+    Vw, Vh, d = VIEWPORT
+    D = _viewport_directions(width, height, Vw, Vh, d).astype(DTYPE)
+    O = np.zeros_like(D)
+
+    colors = _trace_batch(O, D, 1.0, float('inf'), scene)
+    return colors.astype(np.uint8).reshape(height, width, 3)
+
+
+def render_tiled(width: int, height: int, scene: Scene, tile_w: int = 64, tile_h: int = 64) -> np.ndarray:
+    """
+    Vectorized render in tile_w x tile_h tiles instead of one whole-image batch.
+    Each tile's rays, closest-hit buffers and the scene data stay cache-resident
+    while every object is tested against them; the tile is then shaded in one pass.
+    Peak memory is bounded by the tile, not the image. Returns an (H, W, 3) uint8 image.
+    """
+    scene.refresh()
+    Vw, Vh, d = VIEWPORT
+    image = np.empty((height, width, 3), dtype=np.uint8)
+    tables = _material_tables(scene)
+
+    for y0 in range(0, height, tile_h):
+        y1 = min(y0 + tile_h, height)
+        for x0 in range(0, width, tile_w):
+            x1 = min(x0 + tile_w, width)
+            D = _viewport_directions(width, height, Vw, Vh, d, rows=range(y0, y1), cols=range(x0, x1)).astype(DTYPE)
+            colors = _trace_batch(np.zeros_like(D), D, 1.0, float('inf'), scene, tables=tables)
+            image[y0:y1, x0:x1] = colors.astype(np.uint8).reshape(y1 - y0, x1 - x0, 3)
+
+    return image
+
+
+def draw_image(win: GraphWin, image: np.ndarray):
+    """
+    Blit an (H, W, 3) uint8 image onto the window in a single transfer.
+    Uses PIL's ImageTk when available, otherwise a binary PPM PhotoImage.
+    """
+    image = np.ascontiguousarray(image, dtype=np.uint8)
+    height, width, _ = image.shape
+    try:
+        from PIL import Image, ImageTk
+        photo = ImageTk.PhotoImage(Image.fromarray(image), master=win)
+    except ImportError:
+        header = b"P6\n%d %d\n255\n" % (width, height)
+        photo = tkinter.PhotoImage(master=win, data=header + image.tobytes(), format="PPM")
+
+    previous = getattr(win, "frame_item", None)
+    win.frame_item = win.create_image(0, 0, image=photo, anchor="nw")
+    if previous is not None:
+        win.delete(previous)  # replace the last frame rather than stacking canvas items
+    win.frame_photo = photo  # keep a reference so Tk does not drop the image
+
+
+# ---------- Compiled Renderer ----------
+
+def render_numba(width: int, height: int, scene: Scene) -> np.ndarray:
+    """
+    Render a sphere-only scene with the Numba-compiled kernel (requires numba).
+    Returns an (H, W, 3) uint8 image; draw it with draw_image.
+    """
+    from RayKernels import scene_to_arrays, trace_image
+
+    scene.refresh()
+    Vw, Vh, d = VIEWPORT
+    return trace_image(height, width, Vw, Vh, d, *scene_to_arrays(scene), MAX_DEPTH)
+
+
+def render_cuda(width: int, height: int, scene: Scene) -> np.ndarray:
+    """
+    Render a sphere-only scene on the GPU, one CUDA thread per pixel (requires numba and CUDA).
+    The BVH is built on the CPU and traversed on the device. Returns an (H, W, 3) uint8 image.
+    """
+    from CudaKernels import trace_rays
+
+    scene.refresh()
+    Vw, Vh, d = VIEWPORT
+    D = _viewport_directions(width, height, Vw, Vh, d)
+    return trace_rays(np.zeros_like(D), D, scene, MAX_DEPTH).reshape(height, width, 3)
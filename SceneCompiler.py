@@ -0,0 +1,140 @@
+import math
+from SceneObjects import Sphere, Plane, KIND_AMBIENT, KIND_POINT
+
+# ---------- Scene Compiler ----------
+#
+# Generates Python source specialized to one scene and exec's it:
+# spheres and planes are intersected inline with their parameters as
+# literals, other bounded objects get an inline slab test against their
+# box before their own intersect() is called, and lights are unrolled.
+# The arithmetic mirrors the generic path exactly. Literals go through
+# float() so NumPy scalars are emitted as plain floats, not np.float64(...).
+
+
+class CompiledScene:
+    """Scene-specialized closest-hit and lighting functions plus the source they came from."""
+    def __init__(self, source: str, closest, lighting):
+        self.source = source
+        self.closest = closest      # closest(O, D, t_min, t_max) -> (t, obj)
+        self.lighting = lighting    # lighting(px, py, pz, nx, ny, nz, vx, vy, vz, s) -> float
+
+
+def _closest_source(objects: list, env: dict) -> list:
+    lines = [
+        "def closest(O, D, t_min, t_max):",
+        "    ox, oy, oz = O.x, O.y, O.z",
+        "    dx, dy, dz = D.x, D.y, D.z",
+        "    closest_t = inf",
+        "    closest = None",
+        "    a = dx * dx + dy * dy + dz * dz",
+    ]
+    if any(not isinstance(obj, (Sphere, Plane)) for obj in objects):
+        lines.append("    ix = 1.0 / dx if dx else inf")
+        lines.append("    iy = 1.0 / dy if dy else inf")
+        lines.append("    iz = 1.0 / dz if dz else inf")
+
+    for k, obj in enumerate(objects):
+        name = f"obj{k}"
+        env[name] = obj
+        lines.append(f"    # {name}: {type(obj).__name__}")
+
+        if isinstance(obj, Sphere):
+            c = obj.center
+            lines += [
+                f"    cox = ox - {float(c.x)!r}",
+                f"    coy = oy - {float(c.y)!r}",
+                f"    coz = oz - {float(c.z)!r}",
+                "    b = 2 * (dx * cox + dy * coy + dz * coz)",
+                f"    disc = b * b - 4 * a * ((cox * cox + coy * coy + coz * coz) - {float(obj._r2)!r})",
+                "    if disc >= 0:",
+                "        sqrt_disc = sqrt(disc)",
+                "        t = (-b + sqrt_disc) / (2 * a)",
+                "        if t_min <= t <= t_max and t < closest_t:",
+                f"            closest_t = t; closest = {name}",
+                "        t = (-b - sqrt_disc) / (2 * a)",
+                "        if t_min <= t <= t_max and t < closest_t:",
+                f"            closest_t = t; closest = {name}",
+            ]
+        elif isinstance(obj, Plane):
+            n, p = obj.normal, obj.point
+            lines += [
+                f"    denom = dx * {float(n.x)!r} + dy * {float(n.y)!r} + dz * {float(n.z)!r}",
+                "    if abs(denom) >= 1e-6:",
+                f"        t = (({float(p.x)!r} - ox) * {float(n.x)!r} + ({float(p.y)!r} - oy) * {float(n.y)!r} + ({float(p.z)!r} - oz) * {float(n.z)!r}) / denom",
+                "        if t >= 0 and t_min <= t <= t_max and t < closest_t:",
+                f"            closest_t = t; closest = {name}",
+            ]
+        else:
+            lo, hi = obj.bounds()
+            body = [
+                f"ts = {name}.intersect(O, D)",
+                "if ts is not None:",
+                "    for t in ts:",
+                "        if t_min <= t <= t_max and t < closest_t:",
+                f"            closest_t = t; closest = {name}",
+            ]
+            if all(math.isfinite(v) for v in lo + hi):
+                lines.append("    lo = t_min; hi = t_max if t_max < closest_t else closest_t")
+                for axis, o, inv in (0, "ox", "ix"), (1, "oy", "iy"), (2, "oz", "iz"):
+                    lines += [
+                        f"    t1 = ({float(lo[axis])!r} - {o}) * {inv}; t2 = ({float(hi[axis])!r} - {o}) * {inv}",
+                        "    if t1 > t2: t1, t2 = t2, t1",
+                        "    if t1 > lo: lo = t1",
+                        "    if t2 < hi: hi = t2",
+                    ]
+                lines.append("    if lo <= hi:")
+                lines += ["        " + line for line in body]
+            else:
+                lines += ["    " + line for line in body]
+
+    lines.append("    return closest_t, closest")
+    return lines
+
+
+def _lighting_source(lights: list) -> list:
+    lines = [
+        "def lighting(px, py, pz, nx, ny, nz, vx, vy, vz, s):",
+        "    intensity = 0.0",
+    ]
+    for light in lights:
+        li = repr(float(light.intensity))
+        if light.kind == KIND_AMBIENT:
+            lines += [
+                f"    intensity += {li}",
+                "    if intensity >= 1.0: return 1.0",
+            ]
+            continue
+
+        if light.kind == KIND_POINT:
+            q = light.position
+            lines += [
+                f"    lx = {float(q.x)!r} - px; ly = {float(q.y)!r} - py; lz = {float(q.z)!r} - pz",
+                "    length = sqrt(lx * lx + ly * ly + lz * lz)",
+                "    if length == 0: lx = ly = lz = 0.0",
+                "    else: lx = lx / length; ly = ly / length; lz = lz / length",
+            ]
+        else:  # directional, already unit length
+            q = light.direction
+            lines.append(f"    lx = {float(q.x)!r}; ly = {float(q.y)!r}; lz = {float(q.z)!r}")
+
+        lines += [
+            "    n_dot_l = nx * lx + ny * ly + nz * lz",
+            "    if n_dot_l > 0:",
+            f"        intensity += {li} * n_dot_l",
+            "    if s != -1:",
+            "        k = 2 * n_dot_l",
+            "        r_dot_v = (nx * k - lx) * vx + (ny * k - ly) * vy + (nz * k - lz) * vz",
+            "        if r_dot_v > 0:",
+            f"            intensity += {li} * (r_dot_v ** s)",
+            "    if intensity >= 1.0: return 1.0",
+        ]
+    lines.append("    return intensity")
+    return lines
+
+
+def compile_scene(scene) -> CompiledScene:
+    """Generate, exec and return the closest-hit and lighting functions for the scene as it is now."""
+    env = {"sqrt": math.sqrt, "inf": math.inf}
+    source = "\n".join(_closest_source(scene.objects, env) + [""] + _lighting_source(scene.lights)) + "\n"
+    exec(compile(source, "<compiled scene>", "exec"), env)
+    return CompiledScene(source, env["closest"], env["lighting"])
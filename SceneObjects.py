@@ -1,18 +1,125 @@
 import math
 import numpy as np
 from VectorUtilities import Vector
+from ColorUtilities import validate_rgb
+from BoundingVolumes import AABB, BVH, INFINITE_AABB
 from typing import List, Tuple, Optional, Union
 
+try:
+    import _sphere_core  # optional Cython extension, see setup.py
+except ImportError:
+    _sphere_core = None
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit: leaves the function as plain Python."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 Number = Union[int, float]
 
+_sqrt = math.sqrt  # bound once for the per-ray intersect paths
+
 
 # ---------- Scene ----------
 
 class Scene:
-    """Represents a 3D scene with objects and lights."""
+    """
+    Represents a 3D scene with objects and lights.
+    A BVH over the objects and the per-type buckets used by the batched
+    renderers are built here, and rebuilt by refresh() once objects or lights change.
+    """
     def __init__(self, objects: List['SceneObject'], lights: List['Light']):
         self.objects = objects
         self.lights = lights
+        self.compiled = None  # set by compile()
+        self._built_for = None
+        self.refresh()
+
+    def _key(self) -> tuple:
+        """Identity of the current objects and lights, which the derived structures are built for."""
+        return (tuple(map(id, self.objects)), tuple(map(id, self.lights)))
+
+    def is_stale(self) -> bool:
+        """True if objects or lights were added, removed or replaced since refresh() last ran."""
+        return self._key() != self._built_for
+
+    def refresh(self):
+        """
+        Rebuild the BVH, the per-type buckets and, after compile(), the compiled code together
+        if the object or light lists changed. Every renderer calls this once per render;
+        call it before using trace_ray directly. Objects moved or resized in place are not detected.
+        """
+        if self.is_stale():
+            self.bvh = BVH(self.objects)
+            self.partition()
+            if self.compiled is not None:
+                self.compile()
+            self._built_for = self._key()
+
+    def partition(self):
+        """
+        Bucket objects by type as (index, obj) pairs, so batched code dispatches per type
+        rather than per object, and flatten spheres and planes into SoA arrays.
+        """
+        self.spheres, self.cylinders, self.planes, self.tori, self.others = [], [], [], [], []
+        for item in enumerate(self.objects):
+            obj = item[1]
+            if isinstance(obj, Sphere):
+                self.spheres.append(item)
+            elif isinstance(obj, Plane):
+                self.planes.append(item)
+            elif isinstance(obj, Cylinder):
+                self.cylinders.append(item)
+            elif isinstance(obj, Torus):
+                self.tori.append(item)
+            else:
+                self.others.append(item)
+
+        self.sphere_ids = np.array([i for i, _ in self.spheres], dtype=np.intp)
+        self.sphere_centers = np.array([(o.center.x, o.center.y, o.center.z) for _, o in self.spheres],
+                                       dtype=float).reshape(-1, 3)
+        self.sphere_xyz = np.ascontiguousarray(self.sphere_centers.T)  # (3, N): cx, cy, cz rows
+        self.sphere_radii = np.array([o.radius for _, o in self.spheres], dtype=float)
+        self.sphere_r2 = np.array([o._r2 for _, o in self.spheres], dtype=float)
+
+        self.plane_ids = np.array([i for i, _ in self.planes], dtype=np.intp)
+        self.plane_points = np.array([(o.point.x, o.point.y, o.point.z) for _, o in self.planes],
+                                     dtype=float).reshape(-1, 3)
+        self.plane_normals = np.array([(o.normal.x, o.normal.y, o.normal.z) for _, o in self.planes],
+                                      dtype=float).reshape(-1, 3)
+
+    def intersect(self, O: Vector, D: Vector, t_min: float, t_max: float) -> tuple:
+        """Closest hit (t, obj) of O + t*D in [t_min, t_max] via the BVH; obj is None on miss."""
+        return self.bvh.intersect(O, D, t_min, t_max)
+
+    def compile(self):
+        """
+        Generate trace code specialized to the current objects and lights (see SceneCompiler).
+        trace_ray uses it from then on; refresh() regenerates it when objects or lights change.
+        """
+        from SceneCompiler import compile_scene
+        self.compiled = compile_scene(self)
+        return self.compiled
+
+    def __getstate__(self):
+        # Generated functions cannot be pickled; workers regenerate them instead
+        state = self.__dict__.copy()
+        state["compiled"] = self.compiled is not None
+        state["_built_for"] = not self.is_stale()  # object and light ids do not survive pickling
+        return state
+
+    def __setstate__(self, state):
+        recompile = state.pop("compiled")
+        self.__dict__.update(state)
+        # Only a scene that was current when pickled is marked as built for the new ids
+        self._built_for = self._key() if self._built_for else None
+        self.compiled = None
+        if recompile:
+            self.compile()
 
 
 # ---------- Scene Objects ----------
@@ -21,8 +128,12 @@ class SceneObject:
     """
     Base class for all objects in the scene.
     Requires a color attribute and an intersect(O, D) method.
+    Subclasses declare their own fields in __slots__, so instances carry no __dict__.
     """
+    __slots__ = ('color', 'specular', 'axis', 'reflective')
+
     def __init__(self, color: Tuple[int, int, int], specular: int = 500, axis: Vector = Vector(0, 1, 0), reflective: float = 0.0):
+        validate_rgb(color)  # once here, so shading can skip the checks
         self.color = color
         self.specular = specular
         self.axis = axis.normalize() if axis else None
@@ -35,11 +146,30 @@ class SceneObject:
     def normal_at(self, P: Vector) -> Vector:
         raise NotImplementedError("Subclasses must implement the normal_at method.")
 
+    def intersect_batch(self, O: np.ndarray, D: np.ndarray) -> tuple:
+        """
+        Intersect N rays at once (O, D are (N, 3) arrays).
+        Returns (*t_arrays, hit_mask): each t array holds one root per ray (inf where absent).
+        Generic fallback calling intersect per ray; subclasses override with vectorized math.
+        """
+        make = Vector._make  # tolist() yields plain floats, no need to validate
+        results = [self.intersect(make(*o), make(*d)) or () for o, d in zip(O.tolist(), D.tolist())]
+        roots = np.full((max(map(len, results), default=0), len(results)), np.inf)
+        for i, ts in enumerate(results):
+            roots[:len(ts), i] = ts
+        return (*roots, np.isfinite(roots).any(axis=0))
+
+    def bounds(self) -> AABB:
+        """Axis-aligned bounding box; unbounded unless a subclass knows better."""
+        return INFINITE_AABB
+
 
 class Sphere(SceneObject):
     """
     Sphere object in 3D space.
     """
+    __slots__ = ('center', 'radius', '_r2')
+
     def __init__(
         self,
         center: Vector,
@@ -52,31 +182,68 @@ class Sphere(SceneObject):
         super().__init__(color, specular=specular, axis=axis, reflective=reflective)
         self.center = center
         self.radius = radius
+        self._r2 = radius * radius  # cached for intersect
 
     def intersect(self, O: Vector, D: Vector) -> Optional[Tuple[Number, Number]]:
         """
         Solve quadratic equation to find intersection of ray O + t*D with the sphere.
         Returns two t-values or None if no intersection.
         """
-        CO = O - self.center
-        a = D.dot(D)
-        b = 2 * D.dot(CO)
-        c = CO.dot(CO) - self.radius**2
+        if _sphere_core is not None:
+            c = self.center
+            t1, t2 = _sphere_core.intersect(O.x, O.y, O.z, D.x, D.y, D.z, c.x, c.y, c.z, self._r2)
+            return None if t1 != t1 else (t1, t2)  # NaN marks a miss
+
+        # Scalar form of CO = O - C; a = D.D, b = 2 D.CO, c = CO.CO - r^2
+        center = self.center
+        dx, dy, dz = D.x, D.y, D.z
+        COx, COy, COz = O.x - center.x, O.y - center.y, O.z - center.z
+        a = dx * dx + dy * dy + dz * dz
+        b = 2 * (dx * COx + dy * COy + dz * COz)
+        c = (COx * COx + COy * COy + COz * COz) - self._r2
 
         discriminant = b * b - 4 * a * c
         if discriminant < 0:
             return None
 
-        sqrt_disc = math.sqrt(discriminant)
+        sqrt_disc = _sqrt(discriminant)
         t1 = (-b + sqrt_disc) / (2 * a)
         t2 = (-b - sqrt_disc) / (2 * a)
         return (t1, t2)
+
+    def intersect_batch(self, O: np.ndarray, D: np.ndarray) -> tuple:
+        """
+        Vectorized intersect for (N, 3) ray arrays (O may also be a single (3,) origin).
+        Returns (t1, t2, hit_mask) with t1 <= t2; t values are meaningless where hit_mask is False.
+        """
+        CO = O - np.array([self.center.x, self.center.y, self.center.z], dtype=D.dtype)
+        CO = np.broadcast_to(CO, D.shape)
+        a = np.einsum('ij,ij->i', D, D)
+        b = 2 * np.einsum('ij,ij->i', CO, D)
+        c = np.einsum('ij,ij->i', CO, CO) - self._r2
+        disc = b * b - 4 * a * c
+        hit = disc >= 0
+        sqrt_disc = np.sqrt(np.maximum(disc, 0))
+        t1 = (-b - sqrt_disc) / (2 * a)
+        t2 = (-b + sqrt_disc) / (2 * a)
+        return (t1, t2, hit)
     
     def normal_at(self, P: Vector) -> Vector:
-        # Vector from center to P, normalized
-        return (P - self.center).normalize()
+        # Vector from center to P, normalized (inlined to avoid temporaries)
+        center = self.center
+        x, y, z = P.x - center.x, P.y - center.y, P.z - center.z
+        length = math.sqrt(x * x + y * y + z * z)
+        if length == 0:
+            return Vector(0, 0, 0)
+        return Vector(x / length, y / length, z / length)
+
+    def bounds(self):
+        c, r = self.center, self.radius
+        return AABB((c.x - r, c.y - r, c.z - r), (c.x + r, c.y + r, c.z + r))
 
 class Cylinder(SceneObject):
+    __slots__ = ('base_center', 'radius', '_r2', 'height', '_axis_tuple', '_top_center', '_caps')
+
     def __init__(
         self,
         base_center: Vector,
@@ -90,51 +257,109 @@ class Cylinder(SceneObject):
         super().__init__(color, specular=specular, axis=axis, reflective=reflective)
         self.base_center = base_center
         self.radius = radius
+        self._r2 = radius * radius
         self.height = height
 
+        # Axis and cap disks ((center), (outward normal)) as plain floats; fixed, so built once
+        self._axis_tuple = (self.axis.x, self.axis.y, self.axis.z)
+        ax, ay, az = self._axis_tuple
+        self._top_center = base_center + self.axis * height
+        top = self._top_center
+        self._caps = (
+            ((base_center.x, base_center.y, base_center.z), (-ax, -ay, -az)),
+            ((top.x, top.y, top.z), (ax, ay, az)),
+        )
+
     def intersect(self, O, D):
         """
         Intersect ray O + t*D with cylinder (including caps).
         Returns tuple of valid t values or None.
         """
-        axis = self.axis
-        CO = O - self.base_center
+        ax, ay, az = self._axis_tuple
+        base = self.base_center
+        ox, oy, oz = O.x, O.y, O.z
+        dx, dy, dz = D.x, D.y, D.z
+        COx, COy, COz = ox - base.x, oy - base.y, oz - base.z
 
         # Project D and CO onto plane perpendicular to axis
-        D_proj = D - axis * D.dot(axis)
-        CO_proj = CO - axis * CO.dot(axis)
+        da = dx * ax + dy * ay + dz * az
+        ca = COx * ax + COy * ay + COz * az
+        Dpx, Dpy, Dpz = dx - ax * da, dy - ay * da, dz - az * da
+        Cpx, Cpy, Cpz = COx - ax * ca, COy - ay * ca, COz - az * ca
 
-        a = D_proj.dot(D_proj)
-        b = 2 * D_proj.dot(CO_proj)
-        c = CO_proj.dot(CO_proj) - self.radius**2
+        a = Dpx * Dpx + Dpy * Dpy + Dpz * Dpz
+        b = 2 * (Dpx * Cpx + Dpy * Cpy + Dpz * Cpz)
+        c = (Cpx * Cpx + Cpy * Cpy + Cpz * Cpz) - self._r2
 
-        t_side = []
         disc = b*b - 4*a*c
-        if disc >= 0:
-            sqrt_disc = math.sqrt(disc)
+        if disc < 0:
+            return None  # misses the infinite cylinder, so the caps inside it as well
+
+        t_all = []
+        if a > 0:  # rays along the axis never hit the side
+            sqrt_disc = _sqrt(disc)
             for t in [(-b - sqrt_disc) / (2*a), (-b + sqrt_disc) / (2*a)]:
-                P = O + D * t
-                h = (P - self.base_center).dot(axis)
+                # Height of O + t*D above the base, along the axis
+                h = (ox + dx * t - base.x) * ax + (oy + dy * t - base.y) * ay + (oz + dz * t - base.z) * az
                 if 0 <= h <= self.height:
-                    t_side.append(t)
+                    t_all.append(t)
 
         # Check caps
-        t_caps = []
-        for cap_h, cap_normal in [(0, -axis), (self.height, axis)]:
-            denom = D.dot(cap_normal)
+        for (cx, cy, cz), (nx, ny, nz) in self._caps:
+            denom = dx * nx + dy * ny + dz * nz
             if abs(denom) > 1e-6:
-                t = ((self.base_center + axis*cap_h) - O).dot(cap_normal) / denom
+                t = ((cx - ox) * nx + (cy - oy) * ny + (cz - oz) * nz) / denom
                 if t > 0:
-                    P = O + D * t
                     # check if within radius
-                    if (P - (self.base_center + axis*cap_h) - axis*0).length() <= self.radius:
-                        t_caps.append(t)
+                    qx, qy, qz = ox + dx * t - cx, oy + dy * t - cy, oz + dz * t - cz
+                    if _sqrt(qx * qx + qy * qy + qz * qz) <= self.radius:
+                        t_all.append(t)
 
-        t_all = t_side + t_caps
         if not t_all:
             return None
         return tuple(sorted(t_all))
 
+    def intersect_batch(self, O: np.ndarray, D: np.ndarray) -> tuple:
+        """
+        Vectorized intersect for (N, 3) ray arrays: the two side roots, then the bottom and top cap.
+        Caps use the same branch-free stand-in denominator as Plane.intersect_batch.
+        Returns (t_side1, t_side2, t_bottom, t_top, hit_mask) with inf where a root is absent.
+        """
+        dtype = D.dtype
+        axis = np.array(self._axis_tuple, dtype=dtype)
+        base = np.array([self.base_center.x, self.base_center.y, self.base_center.z], dtype=dtype)
+        CO = np.broadcast_to(O - base, D.shape)
+
+        # Side: quadratic in the plane perpendicular to the axis
+        da = np.einsum('ij,j->i', D, axis)
+        ca = np.einsum('ij,j->i', CO, axis)
+        D_proj = D - da[:, None] * axis
+        CO_proj = CO - ca[:, None] * axis
+        a = np.einsum('ij,ij->i', D_proj, D_proj)
+        b = 2 * np.einsum('ij,ij->i', D_proj, CO_proj)
+        c = np.einsum('ij,ij->i', CO_proj, CO_proj) - self._r2
+        disc = b * b - 4 * a * c
+        sqrt_disc = np.sqrt(np.maximum(disc, 0))
+        two_a = np.where(a > 0, 2 * a, 1e30)  # rays along the axis never hit the side
+        roots = []
+        for sign in (-1, 1):
+            t = (-b + sign * sqrt_disc) / two_a
+            h = ca + t * da  # height of O + t*D along the axis
+            roots.append(np.where((disc >= 0) & (a > 0) & (h >= 0) & (h <= self.height), t, np.inf))
+
+        # Caps
+        for cap_center, cap_normal in self._caps:
+            n = np.array(cap_normal, dtype=dtype)
+            cc = np.array(cap_center, dtype=dtype)
+            denom = np.einsum('ij,j->i', D, n)
+            facing = np.abs(denom) > 1e-6
+            t = np.einsum('ij,j->i', np.broadcast_to(cc - O, D.shape), n) / np.where(facing, denom, 1e30)
+            offset = O + D * t[:, None] - cc
+            inside = np.einsum('ij,ij->i', offset, offset) <= self._r2
+            roots.append(np.where(facing & (t > 0) & inside, t, np.inf))
+
+        return (*roots, np.isfinite(roots).any(axis=0))
+
     def normal_at(self, P):
         AP = P - self.base_center
         h = AP.dot(self.axis)
@@ -146,8 +371,21 @@ class Cylinder(SceneObject):
         else:
             axis_point = self.base_center + self.axis * h
             return (P - axis_point).normalize()
+
+    def bounds(self):
+        # Box around both cap disks: each disk extends r*sqrt(1 - a_i^2) along axis i
+        b = self.base_center
+        t = self._top_center
+        a = (self.axis.x, self.axis.y, self.axis.z)
+        ext = [self.radius * math.sqrt(max(0.0, 1 - a_i * a_i)) for a_i in a]
+        return AABB(
+            (min(b.x, t.x) - ext[0], min(b.y, t.y) - ext[1], min(b.z, t.z) - ext[2]),
+            (max(b.x, t.x) + ext[0], max(b.y, t.y) + ext[1], max(b.z, t.z) + ext[2]),
+        )
         
 class Plane(SceneObject):
+    __slots__ = ('point', 'normal')
+
     def __init__(
             self, 
             point: Vector, 
@@ -162,22 +400,125 @@ class Plane(SceneObject):
         self.normal = self.axis.normalize()
 
     def intersect(self, O: Vector, D: Vector) -> Optional[Tuple[Number, Number]]:
-        denom = D.dot(self.normal)
+        n = self.normal
+        nx, ny, nz = n.x, n.y, n.z
+        denom = D.x * nx + D.y * ny + D.z * nz
 
         if abs(denom) < 1e-6:
             return None
-        
-        t = (self.point - O).dot(self.normal) / denom
+
+        p = self.point
+        t = ((p.x - O.x) * nx + (p.y - O.y) * ny + (p.z - O.z) * nz) / denom
 
         if t < 0:
             return None
         
         return (t,)
+
+    def intersect_batch(self, O: np.ndarray, D: np.ndarray) -> tuple:
+        """
+        Vectorized intersect for (N, 3) ray arrays, branch-free: near-parallel rays
+        divide by a huge stand-in denominator and are masked out afterwards.
+        Returns (t, valid).
+        """
+        n = np.array([self.normal.x, self.normal.y, self.normal.z], dtype=D.dtype)
+        p = np.array([self.point.x, self.point.y, self.point.z], dtype=D.dtype)
+        denom = np.einsum('ij,j->i', D, n)
+        num = np.einsum('ij,j->i', np.broadcast_to(p - O, D.shape), n)
+        facing = np.abs(denom) >= 1e-6
+        t = num / np.where(facing, denom, 1e30)
+        return (t, facing & (t >= 0))
     
     def normal_at(self, P: Vector) -> Vector:
         return self.normal
 
+# ---------- Quartic Solver ----------
+
+@njit(cache=True)
+def _solve_cubic_max(a2, a1, a0):
+    """Largest real root of m^3 + a2*m^2 + a1*m + a0 = 0 (Cardano / trigonometric form)."""
+    Q = (3.0 * a1 - a2 * a2) / 9.0
+    R = (9.0 * a2 * a1 - 27.0 * a0 - 2.0 * a2 * a2 * a2) / 54.0
+    disc = Q * Q * Q + R * R
+    if disc >= 0.0:
+        sq = math.sqrt(disc)
+        S = math.copysign(abs(R + sq) ** (1.0 / 3.0), R + sq)
+        T = math.copysign(abs(R - sq) ** (1.0 / 3.0), R - sq)
+        return S + T - a2 / 3.0
+    theta = math.acos(max(-1.0, min(1.0, R / math.sqrt(-Q * Q * Q))))
+    return 2.0 * math.sqrt(-Q) * math.cos(theta / 3.0) - a2 / 3.0
+
+
+NEAR_TANGENT = 1e-10  # quadratic discriminants in (-NEAR_TANGENT, 0) are too close to call
+
+
+@njit(cache=True)
+def _solve_quartic(A, B, C, D, E):
+    """
+    Real roots t > 1e-6 of A*t^4 + B*t^3 + C*t^2 + D*t + E = 0, ascending (Ferrari's method).
+    Depress with t = y - B/(4A), take a positive root m of the resolvent cubic, and split
+    the quartic into two quadratics. Each root gets a Newton step on the original polynomial.
+    Returns (roots, reliable); reliable is False for near-tangent rays, where rounding
+    decides whether a double root is found at all.
+    """
+    b, c, d, e = B / A, C / A, D / A, E / A
+    shift = b / 4.0
+    b2 = b * b
+    p = c - 3.0 * b2 / 8.0
+    q = d - b * c / 2.0 + b2 * b / 8.0
+    r = e - b * d / 4.0 + b2 * c / 16.0 - 3.0 * b2 * b2 / 256.0
+
+    roots = []
+    reliable = True
+
+    # Each quadratic y^2 + k*y + l = 0 as a (k, l) pair
+    if abs(q) < 1e-12:
+        # Biquadratic: y^2 = (-p +- sqrt(p^2 - 4r)) / 2, no real y when p^2 < 4r
+        inner = p * p / 4.0 - r
+        if inner < 0.0:
+            return roots, inner > -NEAR_TANGENT
+        quads = [(0.0, p / 2.0 - math.sqrt(inner)), (0.0, p / 2.0 + math.sqrt(inner))]
+    else:
+        m = _solve_cubic_max(p, p * p / 4.0 - r, -q * q / 8.0)
+        s = math.sqrt(max(2.0 * m, 1e-300))
+        quads = [(s, p / 2.0 + m - q / (2.0 * s)), (-s, p / 2.0 + m + q / (2.0 * s))]
+
+    for k, l in quads:
+        disc = k * k - 4.0 * l
+        if disc < 0.0:
+            if disc > -NEAR_TANGENT:
+                reliable = False
+            continue
+        sq = math.sqrt(disc)
+        for y in ((-k - sq) / 2.0, (-k + sq) / 2.0):
+            t = y - shift
+            # Newton polish against the undepressed polynomial
+            f = (((t + b) * t + c) * t + d) * t + e
+            df = ((4.0 * t + 3.0 * b) * t + 2.0 * c) * t + d
+            if df != 0.0:
+                t -= f / df
+            if t > 1e-6:
+                roots.append(t)
+    roots.sort()
+    return roots, reliable
+
+
+def _eigvals_roots(A: float, B: float, C: float, D: float, E: float) -> list:
+    """
+    Same roots as _solve_quartic via the eigenvalues of the companion matrix;
+    slower but robust for near-tangent rays. Near-real pairs count as (double) real roots.
+    The matrix is built per call, so concurrent threads never share it.
+    """
+    M = np.zeros((4, 4))
+    M[(1, 2, 3), (0, 1, 2)] = 1.0
+    M[:, 3] = (-E / A, -D / A, -C / A, -B / A)
+    roots = np.linalg.eigvals(M)
+    return sorted(t.real for t in roots if abs(t.imag) < 1e-6 and t.real > 1e-6)
+
+
 class Torus(SceneObject):
+    __slots__ = ('center', 'major_radius', 'minor_radius', '_R2', '_r2', '_bsphere_r2', '_u', '_v', '_w')
+
     def __init__(
         self, 
         center: Vector, 
@@ -192,6 +533,16 @@ class Torus(SceneObject):
         self.center = center
         self.major_radius = major_radius
         self.minor_radius = minor_radius
+        self._R2 = major_radius * major_radius
+        self._r2 = minor_radius * minor_radius
+        self._bsphere_r2 = (major_radius + minor_radius) ** 2  # bounding sphere, tested before the quartic
+
+        # Orthonormal basis (u, v, w) with w = axis; the axis is fixed, so build it once
+        w = self.axis
+        u = Vector(1, 0, 0) if abs(w.x) < 0.9 else Vector(0, 1, 0)
+        self._u = (u.cross(w)).normalize()
+        self._v = w.cross(self._u)
+        self._w = w
 
     def intersect(self, O: Vector, D: Vector) -> Optional[float]:
         """
@@ -200,11 +551,7 @@ class Torus(SceneObject):
         D = ray direction (Vector), assumed normalized
         Returns nearest positive t or None.
         """
-        # Build orthonormal basis (u, v, w) with w = axis
-        w = self.axis
-        u = Vector(1, 0, 0) if abs(w.x) < 0.9 else Vector(0, 1, 0)
-        u = (u.cross(w)).normalize()
-        v = w.cross(u)
+        u, v, w = self._u, self._v, self._w
 
         # Transform ray into local torus coordinates
         O_rel = O - self.center
@@ -214,31 +561,34 @@ class Torus(SceneObject):
         # Quartic coefficients (torus aligned to z-axis)
         dx, dy, dz = D_local.x, D_local.y, D_local.z
         ox, oy, oz = O_local.x, O_local.y, O_local.z
-        R, r = self.major_radius, self.minor_radius
+        R2, r2 = self._R2, self._r2
 
         sum_d_sq = dx*dx + dy*dy + dz*dz
-        e = ox*ox + oy*oy + oz*oz - R*R - r*r
+        o_sq = ox*ox + oy*oy + oz*oz
         f = ox*dx + oy*dy + oz*dz
 
-        A = sum_d_sq * sum_d_sq
-        B = 4 * f * sum_d_sq
-        C = 2 * sum_d_sq * e + 4 * f*f + 4 * R*R * dz*dz
-        D_coef = 4 * f * e + 8 * R*R * oz * dz
-        E = e*e - 4 * R*R * (r*r - oz*oz)
+        # Early out: from outside the bounding sphere, the ray misses it or points away from it
+        c = o_sq - self._bsphere_r2
+        if c > 0 and (f > 0 or f*f < sum_d_sq * c):
+            return None
 
-        coeffs = [A, B, C, D_coef, E]
+        e = o_sq - R2 - r2
 
-        # Solve quartic
-        roots = np.roots(coeffs)
-        roots = [t.real for t in roots if abs(t.imag) < 1e-6 and t > 1e-6]
+        A = sum_d_sq * sum_d_sq
+        B = 4 * f * sum_d_sq
+        C = 2 * sum_d_sq * e + 4 * f*f + 4 * R2 * dz*dz
+        D_coef = 4 * f * e + 8 * R2 * oz * dz
+        E = e*e - 4 * R2 * (r2 - oz*oz)
 
+        roots, reliable = _solve_quartic(A, B, C, D_coef, E)
+        if not reliable:
+            roots = _eigvals_roots(A, B, C, D_coef, E)
         if not roots:
             return None
 
         # return all valid intersections (tuple), sorted ascending
-        return tuple(sorted(roots))
+        return tuple(roots)
 
-    
     def normal_at(self, P: Vector) -> Vector:
         """
         Compute normal at point P on torus, accounting for orientation (axis).
@@ -246,11 +596,7 @@ class Torus(SceneObject):
         # Translate point relative to torus center
         P_rel = P - self.center
 
-        # Build a local basis: u, v, w
-        w = self.axis
-        u = Vector(1, 0, 0) if abs(w.x) < 0.9 else Vector(0, 1, 0)
-        u = (u.cross(w)).normalize()
-        v = w.cross(u)
+        u, v, w = self._u, self._v, self._w
 
         # Express P_rel in local coordinates
         x = P_rel.dot(u)
@@ -272,37 +618,63 @@ class Torus(SceneObject):
         N_world = (u * N_local.x + v * N_local.y + w * N_local.z).normalize()
         return N_world
 
+    def bounds(self):
+        # Spine circle extends R*sqrt(1 - w_i^2) along axis i, plus the tube radius
+        c, w = self.center, self.axis
+        ext = [self.major_radius * math.sqrt(max(0.0, 1 - w_i * w_i)) + self.minor_radius for w_i in (w.x, w.y, w.z)]
+        return AABB((c.x - ext[0], c.y - ext[1], c.z - ext[2]), (c.x + ext[0], c.y + ext[1], c.z + ext[2]))
+
     
 # ---------- Lights ----------
 
+# Integer light kinds, cheaper to test than the type strings in the shading loop
+KIND_AMBIENT = 0
+KIND_POINT = 1
+KIND_DIRECTIONAL = 2
+
+_KINDS = {"ambient": KIND_AMBIENT, "point": KIND_POINT, "directional": KIND_DIRECTIONAL}
+
+
 class Light:
-    """Base class for lights."""
-    def __init__(self, type_: str, intensity: float):
+    """
+    Base class for lights. kind (KIND_AMBIENT, KIND_POINT or KIND_DIRECTIONAL)
+    selects how the shading code treats the light; it defaults to the kind named by type_.
+    """
+    __slots__ = ('type', 'intensity', 'kind')
+
+    def __init__(self, type_: str, intensity: float, kind: Optional[int] = None):
         self.type = type_
         if not (0.0 <= intensity <= 1.0):
             raise ValueError("Light intensity must be between 0 and 1.")
+        if kind is None:
+            kind = _KINDS.get(type_)
+        if kind not in _KINDS.values():
+            raise ValueError("Light type must be 'ambient', 'point' or 'directional', or kind a KIND_* constant.")
         self.intensity = intensity
+        self.kind = kind
 
 
 class AmbientLight(Light):
     """Ambient light (uniform, directionless)."""
+    __slots__ = ()
+
     def __init__(self, intensity: float):
-        super().__init__(type_="ambient", intensity=intensity)
+        super().__init__(type_="ambient", intensity=intensity, kind=KIND_AMBIENT)
 
 
 class PointLight(Light):
     """Point light located at a specific position in space."""
+    __slots__ = ('position',)
+
     def __init__(self, intensity: float, position: Vector):
-        super().__init__(type_="point", intensity=intensity)
-        if not (isinstance(position, (list, tuple)) and len(position) == 3):
-            raise TypeError("Position must be a 3-element tuple or list.")
-        self.position = Vector(position[0], position[1], position[2])
+        super().__init__(type_="point", intensity=intensity, kind=KIND_POINT)
+        self.position = Vector.from_any(position)
 
 
 class DirectionalLight(Light):
     """Directional light with a specified direction vector."""
+    __slots__ = ('direction',)
+
     def __init__(self, intensity: float, direction: Vector):
-        super().__init__(type_="directional", intensity=intensity)
-        if not (isinstance(direction, (list, tuple)) and len(direction) == 3):
-            raise TypeError("Direction must be a 3-element tuple or list.")
-        self.direction = Vector(direction[0], direction[1], direction[2])
+        super().__init__(type_="directional", intensity=intensity, kind=KIND_DIRECTIONAL)
+        self.direction = Vector.from_any(direction).normalize()  # unit length, normalized once
@@ -3,7 +3,12 @@ from typing import Union, Tuple, List
 
 Number = Union[int, float]
 
+_sqrt = math.sqrt
+
+
 class Vector:
+    __slots__ = ('x', 'y', 'z')
+
     def __init__(self, x, y, z):
         if not all(isinstance(coord, (int, float)) for coord in (x, y, z)):
             raise TypeError("Coordinates must be numeric.")
@@ -11,36 +16,50 @@ class Vector:
         self.y = y
         self.z = z
 
+    @classmethod
+    def from_any(cls, value) -> "Vector":
+        """Validated conversion of a Vector or an (x, y, z) sequence; use at API boundaries."""
+        if isinstance(value, Vector):
+            return value
+        try:
+            x, y, z = value
+        except (TypeError, ValueError):
+            raise TypeError("Expected a Vector or an (x, y, z) sequence.") from None
+        return cls(x, y, z)
+
+    @classmethod
+    def _make(cls, x, y, z) -> "Vector":
+        """Unchecked constructor for arithmetic results, whose components are already numbers."""
+        v = object.__new__(cls)
+        v.x = x
+        v.y = y
+        v.z = z
+        return v
+
     def __repr__(self):
         return f"Vector({self.x}, {self.y}, {self.z})"
 
         # Vector addition
     def __add__(self, other):
-        if not isinstance(other, Vector):
-            raise TypeError("Operand must be a Vector.")
-        return Vector(self.x + other.x, self.y + other.y, self.z + other.z)
+        return Vector._make(self.x + other.x, self.y + other.y, self.z + other.z)
 
     # Vector subtraction
     def __sub__(self, other):
-        if not isinstance(other, Vector):
-            raise TypeError("Operand must be a Vector.")
-        return Vector(self.x - other.x, self.y - other.y, self.z - other.z)
+        return Vector._make(self.x - other.x, self.y - other.y, self.z - other.z)
 
     # Scalar multiplication
     def __mul__(self, scalar):
-        if not isinstance(scalar, (int, float)):
-            raise TypeError("Operand must be numeric.")
-        return Vector(self.x * scalar, self.y * scalar, self.z * scalar)
+        return Vector._make(self.x * scalar, self.y * scalar, self.z * scalar)
 
     __rmul__ = __mul__  # allow scalar * vector
 
     # Negation
     def __neg__(self):
-        return Vector(-self.x, -self.y, -self.z)
+        return Vector._make(-self.x, -self.y, -self.z)
     
     # Cross product
     def cross(self, other: "Vector") -> "Vector":
-        return Vector(
+        return Vector._make(
             self.y * other.z - self.z * other.y,
             self.z * other.x - self.x * other.z,
             self.x * other.y - self.y * other.x
@@ -48,17 +67,22 @@ class Vector:
     
     # Dot product
     def dot(self, other):
-        if not isinstance(other, Vector):
-            raise TypeError("Operand must be a Vector.")
         return self.x * other.x + self.y * other.y + self.z * other.z
 
     # Length
     def length(self):
-        return math.sqrt(self.dot(self))
+        x, y, z = self.x, self.y, self.z
+        return _sqrt(x * x + y * y + z * z)
 
     # Normalize
     def normalize(self):
         l = self.length()
         if l == 0:
-            return Vector(0, 0, 0)
-        return Vector(self.x / l, self.y / l, self.z / l)
+            return Vector._make(0, 0, 0)
+        return Vector._make(self.x / l, self.y / l, self.z / l)
+
+
+try:
+    from _vector import Vector  # optional Cython build of the same class, see setup.py
+except ImportError:
+    pass
@@ -0,0 +1,63 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Compiled sphere intersection (optional).
+Build with: python setup.py build_ext --inplace
+"""
+from libc.math cimport sqrt, NAN, INFINITY
+
+
+cpdef tuple intersect(double Ox, double Oy, double Oz,
+                      double Dx, double Dy, double Dz,
+                      double cx, double cy, double cz, double r2):
+    """Roots (t1, t2) of |O + t*D - C|^2 = r2, or (NAN, NAN) when the ray misses."""
+    cdef double COx = Ox - cx
+    cdef double COy = Oy - cy
+    cdef double COz = Oz - cz
+    cdef double a = Dx * Dx + Dy * Dy + Dz * Dz
+    cdef double b = 2 * (Dx * COx + Dy * COy + Dz * COz)
+    cdef double c = COx * COx + COy * COy + COz * COz - r2
+    cdef double disc = b * b - 4 * a * c
+    cdef double sqrt_disc
+
+    if disc < 0:
+        return (NAN, NAN)
+    sqrt_disc = sqrt(disc)
+    return ((-b + sqrt_disc) / (2 * a), (-b - sqrt_disc) / (2 * a))
+
+
+cpdef void trace_scene_c(const double[:, ::1] O, const double[:, ::1] D,
+                         const double[:, ::1] centers, const double[::1] r2,
+                         double t_min, double t_max,
+                         double[::1] out_t, Py_ssize_t[::1] out_idx, Py_ssize_t[::1] ids) noexcept nogil:
+    """
+    Closest sphere hit for every ray of a batch, in place.
+    out_t/out_idx hold the current nearest hit and are only lowered; ids maps sphere k to its object index.
+    """
+    cdef Py_ssize_t i, k
+    cdef double COx, COy, COz, dx, dy, dz, a, b, c, disc, sqrt_disc, t1, t2, best
+
+    for i in range(D.shape[0]):
+        dx = D[i, 0]
+        dy = D[i, 1]
+        dz = D[i, 2]
+        a = dx * dx + dy * dy + dz * dz
+        best = out_t[i]
+        for k in range(centers.shape[0]):
+            COx = O[i, 0] - centers[k, 0]
+            COy = O[i, 1] - centers[k, 1]
+            COz = O[i, 2] - centers[k, 2]
+            b = 2 * (dx * COx + dy * COy + dz * COz)
+            c = COx * COx + COy * COy + COz * COz - r2[k]
+            disc = b * b - 4 * a * c
+            if disc < 0:
+                continue
+            sqrt_disc = sqrt(disc)
+            t1 = (-b - sqrt_disc) / (2 * a)
+            t2 = (-b + sqrt_disc) / (2 * a)
+            if t_min <= t1 <= t_max and t1 < best:
+                best = t1
+                out_idx[i] = ids[k]
+            elif t_min <= t2 <= t_max and t2 < best:
+                best = t2
+                out_idx[i] = ids[k]
+        out_t[i] = best
@@ -0,0 +1,89 @@
+# cython: language_level=3, cdivision=True
+"""
+Compiled Vector (optional), a drop-in for VectorUtilities.Vector.
+Components are C doubles, so attribute reads and the arithmetic below are struct field loads.
+Build with: python setup.py build_ext --inplace
+"""
+from libc.math cimport sqrt
+
+
+cdef inline Vector _new(double x, double y, double z):
+    """Unchecked constructor for arithmetic results."""
+    cdef Vector v = Vector.__new__(Vector)
+    v.x = x
+    v.y = y
+    v.z = z
+    return v
+
+
+cdef class Vector:
+    cdef public double x, y, z
+
+    def __init__(self, x, y, z):
+        # Assigning to a C double rejects non-numeric values with a TypeError
+        self.x = x
+        self.y = y
+        self.z = z
+
+    @classmethod
+    def from_any(cls, value):
+        """Validated conversion of a Vector or an (x, y, z) sequence; use at API boundaries."""
+        if isinstance(value, Vector):
+            return value
+        try:
+            x, y, z = value
+        except (TypeError, ValueError):
+            raise TypeError("Expected a Vector or an (x, y, z) sequence.") from None
+        return cls(x, y, z)
+
+    @classmethod
+    def _make(cls, double x, double y, double z):
+        return _new(x, y, z)
+
+    def __reduce__(self):
+        return (Vector, (self.x, self.y, self.z))
+
+    def __repr__(self):
+        return f"Vector({self.x}, {self.y}, {self.z})"
+
+    # Vector addition
+    def __add__(self, Vector other not None):
+        return _new(self.x + other.x, self.y + other.y, self.z + other.z)
+
+    # Vector subtraction
+    def __sub__(self, Vector other not None):
+        return _new(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    # Scalar multiplication
+    def __mul__(self, double scalar):
+        return _new(self.x * scalar, self.y * scalar, self.z * scalar)
+
+    def __rmul__(self, double scalar):
+        return _new(self.x * scalar, self.y * scalar, self.z * scalar)
+
+    # Negation
+    def __neg__(self):
+        return _new(-self.x, -self.y, -self.z)
+
+    # Cross product
+    def cross(self, Vector other not None):
+        return _new(
+            self.y * other.z - self.z * other.y,
+            self.z * other.x - self.x * other.z,
+            self.x * other.y - self.y * other.x
+        )
+
+    # Dot product
+    def dot(self, Vector other not None):
+        return self.x * other.x + self.y * other.y + self.z * other.z
+
+    # Length
+    cpdef double length(self):
+        return sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+    # Normalize
+    cpdef Vector normalize(self):
+        cdef double l = self.length()
+        if l == 0:
+            return _new(0, 0, 0)
+        return _new(self.x / l, self.y / l, self.z / l)
@@ -73,6 +73,7 @@ def main():
     objects = make_objects()
     lights = make_lights()
     scene = Scene(objects, lights)
+    scene.compile()  # scene-specialized trace code; rerun after changing objects or lights
 
     # Render scene
     render_parallel_rows(win, width, height, scene, max_workers=12)
@@ -0,0 +1,9 @@
+from setuptools import setup
+from Cython.Build import cythonize
+
+# Optional compiled extensions. The pure-Python modules fall back to their own
+# implementations when these are not built. Build in place with:
+#   python setup.py build_ext --inplace
+setup(
+    ext_modules=cythonize(["_sphere_core.pyx", "_vector.pyx"], language_level=3),
+)
@@ -0,0 +1,55 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+TESTS = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(TESTS)  # the modules live flat in the repository root
+
+paths = [ROOT]
+if importlib.util.find_spec("graphics") is None:
+    paths.append(os.path.join(TESTS, "stubs"))  # stand-in graphics.py, see stubs/graphics.py
+sys.path[:0] = paths
+# Process-pool workers start from a fresh interpreter and need the same import paths
+os.environ["PYTHONPATH"] = os.pathsep.join(paths + [p for p in [os.environ.get("PYTHONPATH")] if p])
+
+from SceneObjects import (Scene, Sphere, Cylinder, Plane, Torus,
+                          AmbientLight, PointLight, DirectionalLight)
+from VectorUtilities import Vector
+
+
+def make_lights():
+    return [
+        AmbientLight(intensity=0.2),
+        PointLight(intensity=0.6, position=(2, 3, -2)),
+        DirectionalLight(intensity=0.2, direction=(1, 4, 4)),
+    ]
+
+
+@pytest.fixture
+def sphere_scene():
+    """Reflective spheres on a huge 'floor' sphere: every renderer supports it."""
+    return Scene([
+        Sphere(Vector(0, -1, 3), 1, (255, 0, 0), 500, reflective=0.1),
+        Sphere(Vector(2, 0, 4), 1, (0, 0, 255), 500, reflective=0.1),
+        Sphere(Vector(-2, 0, 4), 1, (0, 255, 0), 10, reflective=0.1),
+        Sphere(Vector(0, -5001, 0), 5000, (255, 255, 0), 1000, reflective=0.5),
+    ], make_lights())
+
+
+@pytest.fixture
+def mixed_scene():
+    """The main.py scene: spheres, an angled cylinder, two planes (one a mirror) and a torus."""
+    return Scene([
+        Sphere(Vector(0, -1, 3), 1, (255, 0, 0), 500, reflective=0.1),
+        Sphere(Vector(2, 0, 4), 1, (0, 0, 255), 500, reflective=0.1),
+        Sphere(Vector(-2, 0, 4), 1, (0, 255, 0), 10, reflective=0.1),
+        Cylinder(base_center=Vector(-1, 3, 7), axis=Vector(1, -1, 1), radius=0.5, height=4,
+                 color=(255, 0, 255), specular=500),
+        Plane(point=Vector(0, -2, 0), normal=Vector(0, 1, 0), color=(200, 200, 200), specular=100, axis=Vector(0, 1, 0)),
+        Plane(point=Vector(0, 0, 13), normal=Vector(0, 0, -1), color=(180, 180, 200), specular=500, axis=Vector(0, 0, -1),
+              reflective=0.8),
+        Torus(center=Vector(0, 2.5, 7), major_radius=1.5, minor_radius=0.5, color=(0, 255, 255),
+              specular=300, axis=Vector(1, -1, 1)),
+    ], make_lights())
@@ -0,0 +1,9 @@
+"""
+Stand-in for Zelle's graphics.py, which is not vendored in this repository.
+RayTracing only needs GraphWin as an annotation and in draw_image, which the
+renderer tests replace, so an empty class is enough.
+"""
+
+
+class GraphWin:
+    pass
@@ -0,0 +1,74 @@
+import math
+
+import numpy as np
+
+from BoundingVolumes import BVH, LINEAR_SCAN_LIMIT, closest_hit, ray_aabb, AABB
+from SceneObjects import Sphere, Plane, Cylinder, Torus
+from VectorUtilities import Vector
+
+
+def _objects(n, seed=0):
+    rng = np.random.default_rng(seed)
+    objects = [Plane(point=Vector(0, -3, 0), normal=Vector(0, 1, 0), axis=Vector(0, 1, 0))]
+    for k in range(n):
+        c = Vector(*(rng.uniform(-6, 6, size=3) + (0, 0, 12)).tolist())
+        kind = k % 4
+        if kind == 2:
+            objects.append(Cylinder(c, axis=Vector(*rng.normal(size=3).tolist()), radius=0.4, height=1.5))
+        elif kind == 3:
+            objects.append(Torus(c, 0.8, 0.25, axis=Vector(*rng.normal(size=3).tolist())))
+        else:
+            objects.append(Sphere(c, float(rng.uniform(0.2, 1.0))))
+    return objects
+
+
+def _rays(n, seed=1):
+    rng = np.random.default_rng(seed)
+    for _ in range(n):
+        D = rng.normal(size=3) * (0.4, 0.4, 0.1) + (0, 0, 1)
+        D /= np.linalg.norm(D)
+        yield Vector(*(rng.normal(size=3) * 0.5).tolist()), Vector(*D.tolist())
+
+
+def test_bvh_matches_linear_scan():
+    objects = _objects(60)
+    bvh = BVH(objects)
+    assert bvh.root is not None and bvh.unbounded == [objects[0]]
+    hits = 0
+    for O, D in _rays(3000):
+        expected = closest_hit(objects, O, D, 1e-4, math.inf)
+        assert bvh.intersect(O, D, 1e-4, math.inf) == expected
+        hits += expected[1] is not None and expected[1] is not objects[0]
+    assert hits > 100
+
+
+def test_small_scenes_are_scanned_linearly():
+    objects = _objects(LINEAR_SCAN_LIMIT)  # plus an unbounded plane, which does not count
+    bvh = BVH(objects)
+    assert bvh.root is None
+    assert BVH(objects + _objects(1, seed=1)[1:]).root is not None
+    for O, D in _rays(200):
+        assert bvh.intersect(O, D, 1e-4, math.inf) == closest_hit(objects, O, D, 1e-4, math.inf)
+
+
+def test_flatten_covers_every_bounded_object_once():
+    objects = _objects(40)
+    bvh = BVH(objects)
+    bounds, links, order = bvh.flatten()
+    assert sorted(order) == [i for i, obj in enumerate(objects) if obj not in bvh.unbounded]
+    for k, (left, right, first, count) in enumerate(links):
+        lo, hi = bounds[k][:3], bounds[k][3:]
+        if left < 0:
+            members = [objects[i].bounds() for i in order[first:first + count]]
+        else:
+            assert left > k and right > k  # depth-first: children follow their parent
+            members = [AABB(tuple(bounds[c][:3]), tuple(bounds[c][3:])) for c in (left, right)]
+        for box in members:
+            assert all(l <= b for l, b in zip(lo, box.lo)) and all(h >= b for h, b in zip(hi, box.hi))
+
+
+def test_ray_aabb():
+    box = AABB((-1, -1, 4), (1, 1, 6))
+    assert ray_aabb((0, 0, 0), (math.inf, math.inf, 1.0), box, 0.0, math.inf) == 4.0
+    assert ray_aabb((0, 0, 0), (math.inf, math.inf, 1.0), box, 0.0, 3.0) == math.inf
+    assert ray_aabb((0, 3, 0), (math.inf, math.inf, 1.0), box, 0.0, math.inf) == math.inf
@@ -0,0 +1,23 @@
+import pytest
+
+from SceneObjects import (Light, AmbientLight, PointLight, DirectionalLight,
+                          KIND_AMBIENT, KIND_POINT, KIND_DIRECTIONAL)
+
+
+def test_kind_follows_type():
+    assert Light("ambient", 0.2).kind == KIND_AMBIENT
+    assert Light("point", 0.2).kind == KIND_POINT
+    assert Light("directional", 0.2).kind == KIND_DIRECTIONAL
+    assert AmbientLight(0.2).kind == KIND_AMBIENT
+    assert PointLight(0.5, (1, 2, 3)).kind == KIND_POINT
+    assert DirectionalLight(0.5, (0, 2, 0)).kind == KIND_DIRECTIONAL
+
+
+def test_explicit_kind_for_other_types():
+    assert Light("spot", 0.5, KIND_POINT).kind == KIND_POINT
+    with pytest.raises(ValueError):
+        Light("spot", 0.5)
+    with pytest.raises(ValueError):
+        Light("point", 0.5, 7)
+    with pytest.raises(ValueError):
+        Light("point", 1.5)
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from SceneObjects import Torus, _solve_quartic, _eigvals_roots
+from VectorUtilities import Vector
+
+R, r = 2.0, 0.5
+
+
+def _torus_rays(n, seed=0):
+    """Random tori at the origin hit by rays aimed near them, with the quartic of each pair."""
+    rng = np.random.default_rng(seed)
+    for _ in range(n):
+        torus = Torus(Vector(0.0, 0.0, 0.0), R, r, axis=Vector(*rng.normal(size=3).tolist()))
+        O = rng.normal(size=3) * 5
+        D = rng.normal(size=3) * 1.5 - O
+        D /= np.linalg.norm(D)
+        O, D = Vector(*O.tolist()), Vector(*D.tolist())
+
+        u, v, w = torus._u, torus._v, torus._w
+        ox, oy, oz = O.dot(u), O.dot(v), O.dot(w)
+        dx, dy, dz = D.dot(u), D.dot(v), D.dot(w)
+        s = dx * dx + dy * dy + dz * dz
+        e = ox * ox + oy * oy + oz * oz - R * R - r * r
+        f = ox * dx + oy * dy + oz * dz
+        coefs = (s * s, 4 * f * s, 2 * s * e + 4 * f * f + 4 * R * R * dz * dz,
+                 4 * f * e + 8 * R * R * oz * dz, e * e - 4 * R * R * (r * r - oz * oz))
+        yield torus, O, D, coefs
+
+
+def _reference_roots(coefs):
+    return sorted(t.real for t in np.roots(coefs) if abs(t.imag) < 1e-6 and t.real > 1e-6)
+
+
+def test_ferrari_matches_np_roots():
+    hits = 0
+    for _, _, _, coefs in _torus_rays(2000):
+        roots, reliable = _solve_quartic(*coefs)
+        if not reliable:
+            continue  # near-tangent: Torus.intersect falls back to the eigenvalue solver
+        expected = _reference_roots(coefs)
+        hits += bool(expected)
+        assert roots == pytest.approx(expected, abs=1e-6)
+    assert hits > 100  # the rays actually exercise the solver
+
+
+def test_eigvals_fallback_matches_np_roots():
+    for _, _, _, coefs in _torus_rays(300, seed=1):
+        assert _eigvals_roots(*coefs) == pytest.approx(_reference_roots(coefs), abs=1e-6)
+
+
+def test_torus_intersect_matches_np_roots():
+    for torus, O, D, coefs in _torus_rays(2000, seed=2):
+        expected = _reference_roots(coefs)
+        ts = torus.intersect(O, D)
+        assert list(ts or ()) == pytest.approx(expected, abs=1e-6)
+
+
+def test_biquadratic_without_real_roots():
+    # (t^2 + 1)(t^2 + 4): q == 0 and no real roots
+    assert _solve_quartic(1.0, 0.0, 5.0, 0.0, 4.0) == ([], True)
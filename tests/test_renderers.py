@@ -0,0 +1,158 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+import RayTracing
+from SceneObjects import Scene, Sphere, Cylinder, AmbientLight, PointLight, DirectionalLight
+from VectorUtilities import Vector
+
+SIZE = 48
+
+# The fastmath Numba kernels (trace_image, trace_tile) round differently from the scalar tracer.
+# In the sphere scene that flips the primary rays through (-1/3, -1/4, 1) and (1/3, -1/4, 1),
+# which touch the red sphere with a zero discriminant; they exist whenever the size is a multiple of 12.
+FASTMATH_PIXELS = 2
+
+
+@pytest.fixture(autouse=True)
+def capture_frames(monkeypatch):
+    """Keep the frames the window-based renderers would draw, instead of opening a window."""
+    frames = []
+    monkeypatch.setattr(RayTracing, "draw_image", lambda win, image: frames.append(np.array(image)))
+    monkeypatch.setattr(RayTracing, "DTYPE", np.float64)
+    return frames
+
+
+def sequential(scene, capture_frames, size=SIZE):
+    RayTracing.render_sequential(None, size, size, scene)
+    return capture_frames.pop()
+
+
+def differing_pixels(a, b):
+    return int((a != b).any(axis=-1).sum())
+
+
+@pytest.mark.parametrize("scene_name", ["sphere_scene", "mixed_scene"])
+@pytest.mark.parametrize("renderer", ["render_numpy", "render_tiled"])
+def test_vectorized_matches_sequential(request, capture_frames, scene_name, renderer):
+    scene = request.getfixturevalue(scene_name)
+    expected = sequential(scene, capture_frames)
+    image = getattr(RayTracing, renderer)(SIZE, SIZE, scene)
+    assert image.dtype == np.uint8 and image.shape == (SIZE, SIZE, 3)
+    np.testing.assert_array_equal(image, expected)
+
+
+@pytest.mark.parametrize("backend", ["numba", "cython", "numpy"])
+def test_sphere_backends_match_sequential(monkeypatch, capture_frames, sphere_scene, backend):
+    if backend == "numba" and RayTracing.intersect_all_spheres is None:
+        pytest.skip("numba is not installed")
+    if backend != "numba":
+        monkeypatch.setattr(RayTracing, "intersect_all_spheres", None)
+    if backend == "cython" and RayTracing._sphere_core is None:
+        pytest.skip("_sphere_core is not built")
+    if backend == "numpy":
+        monkeypatch.setattr(RayTracing, "_sphere_core", None)
+    expected = sequential(sphere_scene, capture_frames)
+    np.testing.assert_array_equal(RayTracing.render_numpy(SIZE, SIZE, sphere_scene), expected)
+
+
+@pytest.mark.parametrize("backend", ["numba", "numpy"])
+@pytest.mark.parametrize("scene_name", ["sphere_scene", "mixed_scene"])
+def test_reordered_packets_match_sequential(monkeypatch, request, capture_frames, scene_name, backend):
+    # Small packets, so reflection batches span several and go through reorder_rays
+    scene = request.getfixturevalue(scene_name)
+    if backend == "numba" and RayTracing.intersect_all_spheres is None:
+        pytest.skip("numba is not installed")
+    if backend == "numpy":
+        monkeypatch.setattr(RayTracing, "intersect_all_spheres", None)
+        monkeypatch.setattr(RayTracing, "_sphere_core", None)
+    reordered = []
+    reorder_rays = RayTracing.reorder_rays
+    monkeypatch.setattr(RayTracing, "reorder_rays", lambda D: reordered.append(len(D)) or reorder_rays(D))
+    monkeypatch.setattr(RayTracing, "RAY_CHUNK", 64)
+    expected = sequential(scene, capture_frames)
+    np.testing.assert_array_equal(RayTracing.render_numpy(SIZE, SIZE, scene), expected)
+    assert bool(reordered) == (backend == "numpy")  # the kernels do not use packets
+
+
+def test_compiled_scene_matches_generic(capture_frames, mixed_scene):
+    expected = sequential(mixed_scene, capture_frames)
+    mixed_scene.compile()
+    assert mixed_scene.compiled is not None
+    np.testing.assert_array_equal(sequential(mixed_scene, capture_frames), expected)
+
+
+@pytest.mark.parametrize("renderer", ["render_sequential", "render_numpy", "render_tiled"])
+@pytest.mark.parametrize("compiled", [False, True], ids=["generic", "compiled"])
+def test_objects_added_after_construction_are_rendered(capture_frames, mixed_scene, renderer, compiled):
+    if compiled:
+        mixed_scene.compile()
+    mixed_scene.objects.append(Sphere(Vector(0, 0, 2), 0.3, (255, 0, 0), -1))
+    expected = sequential(Scene(list(mixed_scene.objects), mixed_scene.lights), capture_frames)
+    if renderer == "render_sequential":
+        image = sequential(mixed_scene, capture_frames)
+    else:
+        image = getattr(RayTracing, renderer)(SIZE, SIZE, mixed_scene)
+    assert tuple(image[SIZE // 2, SIZE // 2]) == tuple(expected[SIZE // 2, SIZE // 2])
+    np.testing.assert_array_equal(image, expected)
+    if compiled:  # regenerated for the new object, not dropped
+        assert "obj7: Sphere" in mixed_scene.compiled.source
+
+
+def test_float32_buffers_shade_cylinder_caps(monkeypatch, capture_frames):
+    # Distant caps facing the camera: float32 hit distances alone miss normal_at's 1e-6 cap test
+    scene = Scene([
+        Cylinder(Vector(-1.2, 0, 14), axis=Vector(0, 0, -1), radius=0.9, height=1,
+                 color=(220, 110, 55), specular=10),
+        Cylinder(Vector(1.9, 0.3, 17), axis=Vector(0.1, 0.1, -1), radius=0.8, height=2,
+                 color=(50, 200, 90), specular=-1, reflective=0.3),
+    ], [AmbientLight(0.2), PointLight(0.6, (2, 1, 0)), DirectionalLight(0.2, (1, 4, 4))])
+    expected = sequential(scene, capture_frames, size=80)
+    monkeypatch.setattr(RayTracing, "DTYPE", np.float32)
+    assert differing_pixels(RayTracing.render_numpy(80, 80, scene), expected) == 0
+
+
+def test_numba_renderer_matches_sequential(capture_frames, sphere_scene):
+    pytest.importorskip("numba")
+    expected = sequential(sphere_scene, capture_frames)
+    assert differing_pixels(RayTracing.render_numba(SIZE, SIZE, sphere_scene), expected) <= FASTMATH_PIXELS
+
+
+@pytest.mark.parametrize("scene_name", ["sphere_scene", "mixed_scene"])
+def test_parallel_matches_sequential(request, capture_frames, scene_name):
+    scene = request.getfixturevalue(scene_name)
+    size = 24
+    expected = sequential(scene, capture_frames, size=size)
+    RayTracing.render_parallel_rows(None, size, size, scene, max_workers=2, tile_size=(8, 8))
+    image = capture_frames.pop()
+    if scene_name == "sphere_scene" and RayTracing._kernel_arrays(scene) is not None:
+        # Traced on threads by the fastmath trace_tile kernel
+        assert differing_pixels(image, expected) <= FASTMATH_PIXELS
+    else:
+        np.testing.assert_array_equal(image, expected)
+
+
+def test_concurrent_thread_pool_renders_stay_separate(capture_frames, sphere_scene):
+    if RayTracing._kernel_arrays(sphere_scene) is None:
+        pytest.skip("numba is not installed")
+    # Two sphere scenes rendered at once on the nogil kernel's thread path, told apart by size
+    jobs = [(sphere_scene, 24), (Scene(sphere_scene.objects[1:], sphere_scene.lights), 20)]
+    expected = {size: RayTracing.render_numba(size, size, scene) for scene, size in jobs}
+    with ThreadPoolExecutor(2) as pool:
+        futures = [pool.submit(RayTracing.render_parallel_rows, None, size, size, scene, 2, (4, 4))
+                   for scene, size in jobs]
+        for future in futures:
+            future.result()
+    for image in capture_frames:
+        np.testing.assert_array_equal(image, expected[len(image)])
+    assert len(capture_frames) == 2
+    assert RayTracing._worker_scene is None and RayTracing._worker_frame is None  # nothing pinned
+
+
+def test_cuda_renderer_matches_sequential(capture_frames, sphere_scene):
+    cuda = pytest.importorskip("numba.cuda")
+    if not cuda.is_available():
+        pytest.skip("no CUDA device")
+    expected = sequential(sphere_scene, capture_frames)
+    assert differing_pixels(RayTracing.render_cuda(SIZE, SIZE, sphere_scene), expected) <= FASTMATH_PIXELS
@@ -0,0 +1,74 @@
+import itertools
+import math
+
+import pytest
+
+from ColorUtilities import scale_rgb, scale_rgb_checked, rgb_to_hex
+import VectorUtilities
+
+
+def _reference_scale(color, scalar):
+    """
+    The min/max clamp with rounding half up, as every renderer does. The original scale_rgb
+    used round(), which rounds halves to even (see test_scale_rgb_rounds_half_up).
+    """
+    return tuple(min(255, max(0, math.floor(c * scalar + 0.5))) for c in color)
+
+
+def test_scale_rgb_matches_clamp_and_round():
+    for color in itertools.product((0, 1, 127, 128, 200, 255), repeat=3):
+        for scalar in (0.0, 0.004, 0.5, 0.999, 1.0, 1.3, 2.0, -0.5):
+            assert scale_rgb(color, scalar) == _reference_scale(color, scalar)
+
+
+def test_scale_rgb_rounds_half_up():
+    # Exact ties: round() would give (0, 2, 2)
+    assert scale_rgb((1, 3, 5), 0.5) == (1, 2, 3)
+
+
+def test_scale_rgb_checked_validates():
+    assert scale_rgb_checked((10, 20, 30), 0.5) == scale_rgb((10, 20, 30), 0.5)
+    with pytest.raises(ValueError):
+        scale_rgb_checked((10, 20), 0.5)
+    with pytest.raises(TypeError):
+        scale_rgb_checked((10, 20, "30"), 0.5)
+    with pytest.raises(TypeError):
+        scale_rgb_checked((10, 20, 30), "0.5")
+
+
+def test_rgb_to_hex():
+    for c in range(256):
+        assert rgb_to_hex((c, 255 - c, c // 2)) == "#%02x%02x%02x" % (c, 255 - c, c // 2)
+
+
+def _vector_classes():
+    """The active Vector, plus the compiled one when it is built (the active one then, too)."""
+    classes = [VectorUtilities.Vector]
+    try:
+        from _vector import Vector
+    except ImportError:
+        return classes
+    return classes if Vector in classes else classes + [Vector]
+
+
+@pytest.mark.parametrize("Vector", _vector_classes(), ids=lambda cls: cls.__module__)
+def test_vector_operations(Vector):
+    a, b = Vector(1, 2, 3), Vector(4, 5, 6)
+    assert (a + b).x == 5 and (b - a).z == 3 and (a * 2).y == 4 and (2 * a).y == 4
+    assert a.dot(b) == 32
+    c = a.cross(b)
+    assert (c.x, c.y, c.z) == (-3, 6, -3)
+    assert Vector(3, 4, 0).length() == 5
+    n = Vector(0, 0, 2).normalize()
+    assert (n.x, n.y, n.z) == (0, 0, 1)
+    assert Vector.from_any((1, 2, 3)).y == 2
+    with pytest.raises(TypeError):
+        Vector.from_any(5)
+
+
+@pytest.mark.parametrize("Vector", _vector_classes(), ids=lambda cls: cls.__module__)
+def test_vector_rejects_none(Vector):
+    v = Vector(1, 2, 3)
+    for op in (lambda: v + None, lambda: v - None, lambda: v.dot(None), lambda: v.cross(None)):
+        with pytest.raises((TypeError, AttributeError)):
+            op()